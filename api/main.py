@@ -73,20 +73,27 @@ AUTHOR: AI Document Pipeline Team
 LAST UPDATED: October 2025
 """
 
-from fastapi import FastAPI, HTTPException, Query, Path as PathParam, BackgroundTasks, UploadFile, File, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, Path as PathParam, BackgroundTasks, UploadFile, File, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Literal, Dict
 from datetime import datetime
 import asyncio
 from pathlib import Path
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
 import uuid
 import json
+import weakref
+from collections import defaultdict
 import tempfile
 import shutil
+import mimetypes
+from celery import group
 
 # Optional dependencies for production
 try:
@@ -97,7 +104,15 @@ try:
 except ImportError:
     RATE_LIMITING_AVAILABLE = False
 
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 from src.search_service import SearchService, SearchMode
+from src.database import DatabaseService
+from src.json_utils import ORJSON_AVAILABLE, dumps as json_dumps, loads as json_loads
 from config import settings
 from sqlalchemy import text
 
@@ -133,8 +148,8 @@ class SearchRequest(BaseModel):
     keyword_weight: float = Field(default=0.5, ge=0.0, le=1.0, description="Keyword weight for hybrid")
     semantic_weight: float = Field(default=0.5, ge=0.0, le=1.0, description="Semantic weight for hybrid")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "invoice payment terms",
                 "mode": "hybrid",
@@ -143,6 +158,7 @@ class SearchRequest(BaseModel):
                 "offset": 0
             }
         }
+    )
 
 
 class DocumentMetadata(BaseModel):
@@ -154,9 +170,8 @@ class DocumentMetadata(BaseModel):
     modified_date: Optional[datetime]
     page_count: Optional[int]
 
-    class Config:
-        # Allow extra fields from structured metadata (invoice numbers, amounts, etc.)
-        extra = "allow"
+    # Allow extra fields from structured metadata (invoice numbers, amounts, etc.)
+    model_config = ConfigDict(extra="allow")
 
 
 class SearchResult(BaseModel):
@@ -185,8 +200,8 @@ class SearchResult(BaseModel):
     download_url: str = Field(..., description="Download endpoint URL")
     preview_url: str = Field(..., description="Preview endpoint URL")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 123,
                 "file_name": "invoice_2024_001.pdf",
@@ -206,6 +221,7 @@ class SearchResult(BaseModel):
                 "preview_url": "/api/preview/123"
             }
         }
+    )
 
 
 class SearchResponse(BaseModel):
@@ -221,8 +237,8 @@ class SearchResponse(BaseModel):
     execution_time_ms: float = Field(..., description="Search execution time in milliseconds")
     results: List[SearchResult] = Field(..., description="Search results")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "invoice payment",
                 "mode": "hybrid",
@@ -234,6 +250,7 @@ class SearchResponse(BaseModel):
                 "results": []
             }
         }
+    )
 
 
 class StatsResponse(BaseModel):
@@ -291,7 +308,8 @@ async def lifespan(app: FastAPI):
     - Initialize database connection pool
     - Initialize search service
     - Load any caches
-    - Initialize batch progress tracking
+    - Initialize batch progress tracking (Redis-backed when configured)
+    - Create the upload directory
 
     Shutdown:
     - Close database connections
@@ -306,9 +324,36 @@ async def lifespan(app: FastAPI):
         embedding_provider=settings.embedding_provider
     )
 
-    # Initialize batch progress tracking (in-memory for now, could use Redis for production)
+    # Database service for document lookups, created once so every request
+    # shares its engine/connection pool. Read-only here, so no embedding
+    # service (which would probe Ollama on construction).
+    app.state.database_service = DatabaseService(
+        database_url=settings.database_url,
+        auto_generate_embeddings=False
+    )
+
+    # Initialize batch progress tracking (mirrored to Redis when configured)
     app.state.batch_progress = {}
-    app.state.batch_websockets = {}  # Track active WebSocket connections
+    # Set when a batch started by this process completes or fails
+    app.state.batch_finished = {}
+    # Active WebSocket connections per batch; WeakSet drops sockets that are
+    # garbage collected without an explicit unregister
+    app.state.batch_websockets = defaultdict(weakref.WeakSet)
+
+    # Optional Redis mirror of batch progress, so any API worker can serve
+    # progress polls and WebSockets for a batch uploaded to another worker
+    app.state.progress_redis = None
+    if settings.batch_progress_redis_url:
+        if REDIS_AVAILABLE:
+            app.state.progress_redis = aioredis.from_url(
+                settings.batch_progress_redis_url,
+                decode_responses=True
+            )
+        else:
+            logger.warning("batch_progress_redis_url is set but redis is not installed")
+
+    # Create the upload directory once instead of checking it on every upload
+    UPLOAD_DIR.mkdir(exist_ok=True)
 
     logger.info("FastAPI application started successfully")
 
@@ -316,6 +361,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down FastAPI application...")
+    app.state.database_service.engine.dispose()
+    if app.state.progress_redis is not None:
+        await app.state.progress_redis.aclose()
     # Cleanup handled by SQLAlchemy/asyncio
     logger.info("FastAPI application shutdown complete")
 
@@ -331,8 +379,14 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",  # Swagger UI at /docs
     redoc_url="/redoc",  # ReDoc at /redoc
+    # orjson renders response bodies several times faster than stdlib json
+    # (search results with many hits are the main beneficiary)
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
 )
 
+# Response class for endpoints that serialize their own body (see /api/search)
+FastJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
 # ==============================================================================
 # MIDDLEWARE CONFIGURATION
 # ==============================================================================
@@ -351,6 +405,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers cache preflight results for a day, so uploads and
+    # polling don't pay an extra OPTIONS round-trip every 10 minutes
+    max_age=86400,
 )
 
 # Rate Limiting (optional but recommended for production)
@@ -360,6 +417,153 @@ if RATE_LIMITING_AVAILABLE:
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+# Project root, for resolving relative document paths stored in the database
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Where uploaded files are stored for the Celery workers (created at startup)
+UPLOAD_DIR = Path("uploads")
+
+# Media types the browser can display inline (PDFs, images)
+INLINE_MEDIA_TYPES = frozenset({
+    "application/pdf",
+    "image/jpeg",
+    "image/png",
+    "image/gif",
+    "image/webp",
+    "image/bmp",
+})
+
+# Batch statuses after which no more progress updates are sent
+BATCH_FINAL_STATUSES = frozenset({"complete", "error"})
+
+
+# ==============================================================================
+# UPLOAD HELPERS
+# ==============================================================================
+
+# Copy uploads in large fixed-size chunks: memory stays bounded to one chunk
+# per file regardless of upload size, and far fewer read/write syscalls are
+# made than with shutil's 64 KB default buffer.
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+
+
+def _save_upload(upload: UploadFile, destination: Path) -> int:
+    """
+    Stream an uploaded file to disk chunk by chunk.
+
+    Reads from the underlying SpooledTemporaryFile, never materializing the
+    whole upload as bytes. Uploads large enough to have spooled to disk are
+    copied with os.sendfile(), which moves the data inside the kernel
+    without passing through Python buffers.
+
+    Args:
+        upload: Uploaded file from the request
+        destination: Path to write to
+
+    Returns:
+        Number of bytes written
+    """
+    source = upload.file
+    source.seek(0)
+
+    # _rolled is False while SpooledTemporaryFile is still in memory
+    if hasattr(os, "sendfile") and getattr(source, "_rolled", False):
+        try:
+            return _sendfile_upload(source, destination)
+        except OSError as e:
+            logger.debug(f"sendfile unavailable for {destination.name}, copying in chunks: {e}")
+            source.seek(0)
+
+    written = 0
+    with open(destination, "wb") as buffer:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def _sendfile_upload(source, destination: Path) -> int:
+    """Copy a disk-backed upload to destination with os.sendfile()."""
+    in_fd = source.fileno()
+    size = os.fstat(in_fd).st_size
+    offset = 0
+    with open(destination, "wb") as buffer:
+        out_fd = buffer.fileno()
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, min(UPLOAD_CHUNK_SIZE, size - offset))
+            if sent == 0:
+                break
+            offset += sent
+    return offset
+
+
+async def _save_upload_async(upload: UploadFile, destination: Path) -> int:
+    """
+    Save an upload without blocking the event loop.
+
+    Disk writes run in the threadpool so other requests (and WebSocket
+    progress updates) keep being served while large files are written.
+    """
+    return await run_in_threadpool(_save_upload, upload, destination)
+
+
+async def _save_request_body(request: Request, destination: Path) -> int:
+    """
+    Write a raw request body to disk as it arrives from the socket.
+
+    Unlike UploadFile, nothing is spooled to a temporary file first: received
+    chunks are gathered into UPLOAD_CHUNK_SIZE writes that run in the
+    threadpool.
+    """
+    buffer = await run_in_threadpool(open, destination, "wb")
+    written = 0
+    pending = bytearray()
+    try:
+        async for chunk in request.stream():
+            pending += chunk
+            if len(pending) >= UPLOAD_CHUNK_SIZE:
+                await run_in_threadpool(buffer.write, pending)
+                written += len(pending)
+                pending = bytearray()
+        if pending:
+            await run_in_threadpool(buffer.write, pending)
+            written += len(pending)
+    finally:
+        await run_in_threadpool(buffer.close)
+    return written
+
+
+# Files from one batch request saved at the same time
+BATCH_UPLOAD_CONCURRENCY = int(os.getenv("BATCH_UPLOAD_CONCURRENCY", "16"))
+
+
+async def _save_uploads(uploads: List[tuple]) -> List:
+    """
+    Save several uploads concurrently.
+
+    Args:
+        uploads: (UploadFile, destination Path) pairs
+
+    Returns:
+        Per upload, bytes written or the exception that stopped it
+        (same order as uploads)
+    """
+    semaphore = asyncio.Semaphore(BATCH_UPLOAD_CONCURRENCY)
+
+    async def save_one(upload: UploadFile, destination: Path) -> int:
+        async with semaphore:
+            return await _save_upload_async(upload, destination)
+
+    return await asyncio.gather(
+        *(save_one(upload, destination) for upload, destination in uploads),
+        return_exceptions=True
+    )
+
+
 # ==============================================================================
 # API ENDPOINTS
 # ==============================================================================
@@ -398,6 +602,9 @@ async def health_check():
     - Monitoring systems
     - Deployment validation
     """
+    # One timestamp per check, shared by the healthy and failure responses
+    now = datetime.now()
+
     try:
         # Check database connection
         stats = app.state.search_service.get_statistics()
@@ -418,7 +625,7 @@ async def health_check():
             status=status,
             database=db_healthy,
             search_service=search_healthy,
-            timestamp=datetime.now()
+            timestamp=now
         )
 
     except Exception as e:
@@ -427,7 +634,7 @@ async def health_check():
             status="unhealthy",
             database=False,
             search_service=False,
-            timestamp=datetime.now()
+            timestamp=now
         )
 
 
@@ -514,7 +721,15 @@ async def get_statistics():
         raise HTTPException(status_code=500, detail="Failed to retrieve statistics")
 
 
-@app.get("/api/search", response_model=SearchResponse, tags=["Search"])
+# No response_model: FastAPI would dump the returned SearchResponse to a dict
+# and validate that dict again, rebuilding every result and its metadata.
+# The model is still declared under responses= for the OpenAPI docs.
+@app.get(
+    "/api/search",
+    response_model=None,
+    responses={200: {"model": SearchResponse}},
+    tags=["Search"],
+)
 async def search_documents(
     q: str = Query(..., min_length=1, max_length=500, description="Search query"),
     mode: Literal["keyword", "semantic", "hybrid"] = Query(
@@ -555,7 +770,6 @@ async def search_documents(
     - Execution time for monitoring
     """
     try:
-        import time
         start_time = time.time()
 
         # Convert mode string to enum
@@ -649,7 +863,7 @@ async def search_documents(
                     preview_url=f"/api/preview/{result.id}"
                 ))
 
-        return SearchResponse(
+        response = SearchResponse(
             query=q,
             mode=mode,
             total_results=len(results),  # TODO: Get total count from DB
@@ -659,6 +873,8 @@ async def search_documents(
             execution_time_ms=execution_time_ms,
             results=search_results
         )
+        # Already validated on construction; serialize it once
+        return FastJSONResponse(response.model_dump(mode="json"))
 
     except Exception as e:
         logger.error(f"Search failed: {e}", exc_info=True)
@@ -684,12 +900,8 @@ async def get_document(
     - Retrieve metadata
     """
     try:
-        # Get document from database service directly
-        from src.database import DatabaseService
-        from config import settings
-
-        db_service = DatabaseService(database_url=settings.database_url)
-        doc = db_service.get_document_by_id(document_id)
+        # Get document from the shared database service
+        doc = app.state.database_service.get_document_by_id(document_id)
 
         if not doc:
             raise HTTPException(status_code=404, detail="Document not found")
@@ -757,9 +969,7 @@ async def download_document(
 
         # If relative path, resolve from project root
         if not file_path.is_absolute():
-            # Get project root (parent of api directory)
-            project_root = Path(__file__).parent.parent
-            file_path = (project_root / file_path).resolve()
+            file_path = (PROJECT_ROOT / file_path).resolve()
         else:
             file_path = file_path.resolve()
 
@@ -774,7 +984,6 @@ async def download_document(
         #     raise HTTPException(status_code=403, detail="Access denied")
 
         # Determine media type based on file extension
-        import mimetypes
         media_type, _ = mimetypes.guess_type(file_name)
         if not media_type:
             media_type = "application/octet-stream"
@@ -789,7 +998,7 @@ async def download_document(
         )
 
         # Set Content-Disposition to inline for viewable files (PDFs, images)
-        if media_type in ['application/pdf', 'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'image/bmp']:
+        if media_type in INLINE_MEDIA_TYPES:
             response.headers["Content-Disposition"] = f'inline; filename="{file_name}"'
 
         return response
@@ -872,11 +1081,13 @@ async def batch_upload(
     The actual processing happens asynchronously in the background using Celery.
     Use the WebSocket endpoint /ws/batch-progress/{batch_id} to track progress.
     """
+    batch_id = None
     try:
         # Generate unique batch ID
         batch_id = str(uuid.uuid4())
 
-        # Initialize batch progress
+        # Initialize batch progress (dropping old finished batches if needed)
+        _trim_batch_progress()
         app.state.batch_progress[batch_id] = {
             "current": 0,
             "total": len(files),
@@ -887,22 +1098,38 @@ async def batch_upload(
             "results": [],
             "status": "pending"
         }
+        app.state.batch_finished[batch_id] = asyncio.Event()
 
         # Save files temporarily
         temp_dir = Path(tempfile.gettempdir()) / f"batch_{batch_id}"
         temp_dir.mkdir(exist_ok=True)
 
+        # Save files concurrently; a file that fails to save is reported as a
+        # failed result instead of failing the whole batch. Each destination
+        # gets a uuid prefix so two uploads with the same name don't write
+        # the same path at the same time.
+        uploads = [(file, temp_dir / f"{uuid.uuid4()}_{file.filename}") for file in files]
+        outcomes = await _save_uploads(uploads)
+
         saved_files = []
-        for file in files:
-            # Save file
-            file_path = temp_dir / file.filename
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+        for (file, file_path), outcome in zip(uploads, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to save {file.filename}: {outcome}")
+                app.state.batch_progress[batch_id]["failureCount"] += 1
+                app.state.batch_progress[batch_id]["results"].append({
+                    "filename": file.filename,
+                    "success": False,
+                    "error": f"Upload failed: {outcome}"
+                })
+                continue
             saved_files.append({
                 "filename": file.filename,
                 "path": str(file_path)
             })
 
+        # Publish the initial state so other API workers know the batch
+        await _broadcast_batch_progress(batch_id)
+
         # Submit batch to Celery for processing
         background_tasks.add_task(
             process_batch_background,
@@ -921,9 +1148,166 @@ async def batch_upload(
 
     except Exception as e:
         logger.error(f"Batch upload failed: {e}", exc_info=True)
+
+        # The background task never started, so nothing else will finish
+        # this batch: mark it failed and release its waiters, otherwise it
+        # stays "pending" (never trimmed, WebSockets wait forever)
+        progress = app.state.batch_progress.get(batch_id)
+        if progress is not None:
+            progress["status"] = "error"
+            progress["currentFile"] = f"Error: {str(e)}"
+            try:
+                await _broadcast_batch_progress(batch_id)
+            except Exception as broadcast_error:
+                logger.warning(f"Failed to broadcast batch {batch_id} error: {broadcast_error}")
+        finished = app.state.batch_finished.get(batch_id)
+        if finished is not None:
+            finished.set()
+
         raise HTTPException(status_code=500, detail=f"Batch upload failed: {str(e)}")
 
 
+# How often pending Celery tasks are checked, and how long the batch waits
+# without any task finishing before giving up on the rest
+BATCH_POLL_INTERVAL = 0.5  # seconds
+BATCH_TASK_TIMEOUT = 300  # seconds
+
+# How long batch progress stays in Redis after its last update
+BATCH_PROGRESS_TTL = 3600  # seconds
+
+# Published on a batch channel after its final snapshot. Subscribers stop on
+# it instead of decoding every snapshot (which grows with the batch) just to
+# read its status.
+BATCH_DONE_MESSAGE = "done"
+
+
+# Batches whose progress this process keeps in memory. Checked only when a new
+# batch starts, and only finished batches are dropped (oldest first), so the
+# count can briefly run over - cheap, amortized trimming in the spirit of
+# Redis' approximate MAXLEN ~.
+MAX_TRACKED_BATCHES = 1000
+
+
+def _trim_batch_progress() -> None:
+    """Forget the oldest finished batches once MAX_TRACKED_BATCHES is exceeded."""
+    excess = len(app.state.batch_progress) - MAX_TRACKED_BATCHES + 1
+    if excess <= 0:
+        return
+
+    # Dicts keep insertion order, so this walks the oldest batches first
+    for batch_id in list(app.state.batch_progress):
+        if excess <= 0:
+            break
+        finished = app.state.batch_finished.get(batch_id)
+        if finished is not None and finished.is_set():
+            del app.state.batch_progress[batch_id]
+            del app.state.batch_finished[batch_id]
+            excess -= 1
+
+
+def _progress_key(batch_id: str) -> str:
+    """Redis key holding the latest progress snapshot of a batch."""
+    return f"batch_progress:{batch_id}"
+
+
+def _progress_channel(batch_id: str) -> str:
+    """Redis pub/sub channel carrying progress updates of a batch."""
+    return f"batch:{batch_id}"
+
+
+def _collect_finished_tasks(backend, task_infos: List[Dict]) -> tuple:
+    """
+    Fetch the state of every pending task in a single result-backend MGET.
+
+    Returns:
+        (finished, still pending), where finished holds
+        (task_info, result, error) tuples
+    """
+    by_id = {task_info["task_id"]: task_info for task_info in task_infos}
+    finished = []
+    # One pass over the backend (no waiting); only finished tasks are yielded
+    for task_id, meta in backend.get_many(list(by_id), interval=0, max_iterations=1):
+        task_info = by_id.pop(task_id)
+        if meta["status"] == "SUCCESS":
+            finished.append((task_info, meta["result"], None))
+        else:
+            finished.append((task_info, None, backend.exception_to_python(meta["result"])))
+    return finished, list(by_id.values())
+
+
+def _ws_payload(message: Dict) -> str:
+    """
+    Encode a WebSocket message as JSON text.
+
+    Uses orjson when installed (much faster than the stdlib json behind
+    send_json). Sent as a text frame because the frontend JSON.parse()s
+    event.data, which would be a Blob for binary frames.
+    """
+    return json_dumps(message)
+
+
+def _parse_payload(payload: str) -> Dict:
+    """Decode a progress snapshot produced by _ws_payload."""
+    return json_loads(payload)
+
+
+async def _load_batch_progress(batch_id: str) -> Optional[Dict]:
+    """
+    Return the progress of a batch, or None if it is unknown.
+
+    Batches uploaded to this process are read from memory; otherwise the
+    Redis snapshot (when configured) is used.
+    """
+    progress = app.state.batch_progress.get(batch_id)
+    if progress is None and app.state.progress_redis is not None:
+        payload = await app.state.progress_redis.get(_progress_key(batch_id))
+        if payload is not None:
+            progress = _parse_payload(payload)
+    return progress
+
+
+async def _broadcast_batch_progress(batch_id: str) -> None:
+    """
+    Push the current batch progress to every WebSocket watching the batch.
+
+    The payload is serialized once. With Redis configured it is stored as the
+    batch snapshot and published on the batch channel, where every worker's
+    WebSocket handlers pick it up. Otherwise it is sent to this process's
+    clients concurrently, so one slow client does not delay the others;
+    clients whose send fails are unregistered.
+    """
+    redis = app.state.progress_redis
+    if redis is not None:
+        progress = app.state.batch_progress[batch_id]
+        payload = _ws_payload(progress)
+        channel = _progress_channel(batch_id)
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(_progress_key(batch_id), payload, ex=BATCH_PROGRESS_TTL)
+                pipe.publish(channel, payload)
+                if progress["status"] in BATCH_FINAL_STATUSES:
+                    pipe.publish(channel, BATCH_DONE_MESSAGE)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish batch progress to Redis: {e}")
+        return
+
+    websockets = list(app.state.batch_websockets.get(batch_id, ()))
+    if not websockets:
+        return
+
+    payload = _ws_payload(app.state.batch_progress[batch_id])
+    results = await asyncio.gather(
+        *(ws.send_text(payload) for ws in websockets),
+        return_exceptions=True
+    )
+
+    for ws, result in zip(websockets, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to send WebSocket update: {result}")
+            app.state.batch_websockets[batch_id].discard(ws)
+
+
 async def process_batch_background(batch_id: str, saved_files: List[Dict], temp_dir: Path):
     """
     Process batch of documents using Celery tasks.
@@ -931,44 +1315,81 @@ async def process_batch_background(batch_id: str, saved_files: List[Dict], temp_
     This function submits each file to the existing Celery infrastructure
     for distributed processing.
     """
+    # Bound once: the result loop below updates these for every file
+    progress = app.state.batch_progress[batch_id]
+    results = progress["results"]
+    total = len(saved_files)
+
     try:
         # Import Celery tasks
         from src.celery_tasks import classify_document_task
 
         # Update status to processing
-        app.state.batch_progress[batch_id]["status"] = "processing"
+        progress["status"] = "processing"
 
-        # Submit each file to Celery
-        celery_tasks = []
-        for file_info in saved_files:
-            # Submit to Celery
-            task = classify_document_task.delay(
+        # Submit all files to Celery as one group: the messages are published
+        # over a single producer connection instead of one round-trip per file
+        group_result = group(
+            classify_document_task.s(
                 file_path_str=file_info["path"],
                 categories=settings.categories,
                 include_reasoning=False
             )
-            celery_tasks.append({
+            for file_info in saved_files
+        ).apply_async()
+
+        celery_tasks = [
+            {
                 "filename": file_info["filename"],
                 "task_id": task.id,
                 "task": task
-            })
-
-        # Monitor Celery tasks and update progress
-        for idx, task_info in enumerate(celery_tasks):
-            filename = task_info["filename"]
-            task = task_info["task"]
-
-            # Update current file being processed
-            app.state.batch_progress[batch_id]["currentFile"] = filename
-
-            # Wait for task to complete
-            try:
-                result = task.get(timeout=300)  # 5 minute timeout per file
+            }
+            for file_info, task in zip(saved_files, group_result.results)
+        ]
+
+        # Collect results in completion order without blocking the event loop:
+        # all pending tasks are checked with one backend MGET in the threadpool
+        # and the coroutine sleeps between checks. If no task finishes for
+        # BATCH_TASK_TIMEOUT seconds the remaining files are marked as failed.
+        pending = celery_tasks
+        completed = 0
+        last_progress = time.monotonic()
+
+        while pending:
+            outcomes, pending = await run_in_threadpool(
+                _collect_finished_tasks, group_result.backend, pending
+            )
 
-                # Update progress
-                if result.get("success"):
-                    app.state.batch_progress[batch_id]["successCount"] += 1
-                    app.state.batch_progress[batch_id]["results"].append({
+            if outcomes:
+                last_progress = time.monotonic()
+            elif time.monotonic() - last_progress > BATCH_TASK_TIMEOUT:
+                outcomes = [
+                    (task_info, None, TimeoutError(f"No result after {BATCH_TASK_TIMEOUT}s"))
+                    for task_info in pending
+                ]
+                pending = []
+            else:
+                await asyncio.sleep(BATCH_POLL_INTERVAL)
+                continue
+
+            for task_info, result, error in outcomes:
+                filename = task_info["filename"]
+                task = task_info["task"]
+
+                # Update current file being processed
+                progress["currentFile"] = filename
+
+                if error is not None:
+                    logger.error(f"Task failed for {filename}: {error}")
+                    progress["failureCount"] += 1
+                    results.append({
+                        "filename": filename,
+                        "success": False,
+                        "error": str(error)
+                    })
+                elif result.get("success"):
+                    progress["successCount"] += 1
+                    results.append({
                         "filename": filename,
                         "success": True,
                         "category": result.get("category"),
@@ -976,46 +1397,29 @@ async def process_batch_background(batch_id: str, saved_files: List[Dict], temp_
                         "task_id": task.id
                     })
                 else:
-                    app.state.batch_progress[batch_id]["failureCount"] += 1
-                    app.state.batch_progress[batch_id]["results"].append({
+                    progress["failureCount"] += 1
+                    results.append({
                         "filename": filename,
                         "success": False,
                         "error": result.get("error", "Unknown error"),
                         "task_id": task.id
                     })
 
-            except Exception as e:
-                logger.error(f"Task failed for {filename}: {e}")
-                app.state.batch_progress[batch_id]["failureCount"] += 1
-                app.state.batch_progress[batch_id]["results"].append({
-                    "filename": filename,
-                    "success": False,
-                    "error": str(e)
-                })
+                completed += 1
 
-            # Update overall progress
-            app.state.batch_progress[batch_id]["current"] = idx + 1
-            app.state.batch_progress[batch_id]["percent"] = ((idx + 1) / len(saved_files)) * 100
+            # Update overall progress once per poll (clients only see it on broadcast)
+            progress["current"] = completed
+            progress["percent"] = (completed / total) * 100
 
             # Notify connected WebSockets
-            if batch_id in app.state.batch_websockets:
-                for ws in app.state.batch_websockets[batch_id]:
-                    try:
-                        await ws.send_json(app.state.batch_progress[batch_id])
-                    except Exception as e:
-                        logger.warning(f"Failed to send WebSocket update: {e}")
+            await _broadcast_batch_progress(batch_id)
 
         # Mark as complete
-        app.state.batch_progress[batch_id]["status"] = "complete"
-        app.state.batch_progress[batch_id]["currentFile"] = "Complete"
+        progress["status"] = "complete"
+        progress["currentFile"] = "Complete"
 
         # Final WebSocket notification
-        if batch_id in app.state.batch_websockets:
-            for ws in app.state.batch_websockets[batch_id]:
-                try:
-                    await ws.send_json(app.state.batch_progress[batch_id])
-                except Exception as e:
-                    logger.warning(f"Failed to send final WebSocket update: {e}")
+        await _broadcast_batch_progress(batch_id)
 
         # Cleanup temp directory
         try:
@@ -1026,8 +1430,12 @@ async def process_batch_background(batch_id: str, saved_files: List[Dict], temp_
 
     except Exception as e:
         logger.error(f"Batch processing failed for {batch_id}: {e}", exc_info=True)
-        app.state.batch_progress[batch_id]["status"] = "error"
-        app.state.batch_progress[batch_id]["currentFile"] = f"Error: {str(e)}"
+        progress["status"] = "error"
+        progress["currentFile"] = f"Error: {str(e)}"
+        await _broadcast_batch_progress(batch_id)
+    finally:
+        # Release WebSocket handlers waiting for the batch to finish
+        app.state.batch_finished[batch_id].set()
 
 
 @app.websocket("/ws/batch-progress/{batch_id}")
@@ -1043,46 +1451,64 @@ async def batch_progress_websocket(websocket: WebSocket, batch_id: str):
     - Individual document results
 
     The connection remains open until all files are processed or client disconnects.
+
+    With Redis configured, updates are streamed from the batch's pub/sub
+    channel, so the batch may be running on any API worker.
     """
     await websocket.accept()
 
-    # Register WebSocket connection
-    if batch_id not in app.state.batch_websockets:
-        app.state.batch_websockets[batch_id] = []
-    app.state.batch_websockets[batch_id].append(websocket)
+    redis = app.state.progress_redis
+    pubsub = None
+    if redis is None:
+        # Register WebSocket connection
+        app.state.batch_websockets[batch_id].add(websocket)
+    else:
+        # Subscribe before reading the snapshot so no update is missed
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(_progress_channel(batch_id))
 
     try:
         # Check if batch exists
-        if batch_id not in app.state.batch_progress:
-            await websocket.send_json({
+        progress = await _load_batch_progress(batch_id)
+        finished = app.state.batch_finished.get(batch_id)
+        if progress is None:
+            await websocket.send_text(_ws_payload({
                 "error": "Batch ID not found"
-            })
+            }))
             await websocket.close()
             return
 
         # Send initial state
-        await websocket.send_json(app.state.batch_progress[batch_id])
-
-        # Keep connection alive and send updates
-        while True:
-            # Check if batch is complete
-            if app.state.batch_progress[batch_id]["status"] in ["complete", "error"]:
-                # Send final state
-                await websocket.send_json(app.state.batch_progress[batch_id])
-                break
+        await websocket.send_text(_ws_payload(progress))
+
+        if pubsub is not None:
+            # Forward published snapshots until the batch finishes
+            if progress["status"] not in BATCH_FINAL_STATUSES:
+                async for message in pubsub.listen():
+                    if message["data"] == BATCH_DONE_MESSAGE:
+                        break
+                    await websocket.send_text(message["data"])
+            return
 
-            # Wait for updates (updates are pushed from process_batch_background)
-            await asyncio.sleep(0.5)
+        # Updates (including the final state) are pushed by
+        # _broadcast_batch_progress; just hold the connection open until the
+        # batch finishes. Dead clients are detected by uvicorn's ping frames.
+        if finished is not None:
+            await finished.wait()
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for batch {batch_id}")
     except Exception as e:
         logger.error(f"WebSocket error for batch {batch_id}: {e}")
     finally:
+        if pubsub is not None:
+            await pubsub.aclose()
+
         # Unregister WebSocket connection
-        if batch_id in app.state.batch_websockets:
-            app.state.batch_websockets[batch_id].remove(websocket)
-            if not app.state.batch_websockets[batch_id]:
+        connections = app.state.batch_websockets.get(batch_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
                 del app.state.batch_websockets[batch_id]
 
 
@@ -1093,10 +1519,11 @@ async def get_batch_progress(batch_id: str):
 
     Use this if WebSocket is not available. Returns current state of batch processing.
     """
-    if batch_id not in app.state.batch_progress:
+    progress = await _load_batch_progress(batch_id)
+    if progress is None:
         raise HTTPException(status_code=404, detail="Batch ID not found")
 
-    return app.state.batch_progress[batch_id]
+    return progress
 
 
 # ==============================================================================
@@ -1118,41 +1545,75 @@ async def upload_document(file: UploadFile = File(...)):
     try:
         # Save file
         file_id = str(uuid.uuid4())
-        upload_dir = Path("uploads")
-        upload_dir.mkdir(exist_ok=True)
 
-        file_path = upload_dir / f"{file_id}_{file.filename}"
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        file_path = UPLOAD_DIR / f"{file_id}_{file.filename}"
+        await _save_upload_async(file, file_path)
 
-        # Create database record
-        with app.state.search_service.engine.connect() as conn:
-            result = conn.execute(
-                text("""
-                    INSERT INTO documents (file_name, file_path, processing_status, created_at)
-                    VALUES (:file_name, :file_path, 'queued', NOW())
-                    RETURNING id
-                """),
-                {"file_name": file.filename, "file_path": str(file_path)}
-            )
-            conn.commit()
-            document_id = result.fetchone()[0]
+        return _queue_uploaded_document(file.filename, file_path)
+
+    except Exception as e:
+        logger.error(f"Upload failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
-        # Queue task for processing (distributed to Celery workers)
-        task = process_document_task.delay(document_id, str(file_path))
 
-        return {
-            "document_id": document_id,
-            "task_id": task.id,
-            "status": "queued",
-            "message": "Document queued for processing. Check status with task_id."
-        }
+@app.post("/api/upload-stream", tags=["Upload"])
+async def upload_document_stream(
+    request: Request,
+    filename: str = Query(..., description="Original file name")
+):
+    """
+    Upload a single document sent as the raw request body.
+
+    Same result as /api/upload, but the body is written straight to the
+    upload directory as it arrives instead of being parsed as multipart and
+    spooled to a temporary file first. Faster for large files.
+
+    Example:
+        curl -X POST --data-binary @invoice.pdf \
+            "http://localhost:8000/api/upload-stream?filename=invoice.pdf"
+    """
+    # Only keep the name part, so the client can't choose the directory
+    filename = Path(filename).name
+    if not filename:
+        raise HTTPException(status_code=400, detail="filename is required")
+
+    file_path = UPLOAD_DIR / f"{uuid.uuid4()}_{filename}"
+    try:
+        await _save_request_body(request, file_path)
+        return _queue_uploaded_document(filename, file_path)
 
     except Exception as e:
-        logger.error(f"Upload failed: {e}")
+        logger.error(f"Streaming upload failed: {e}")
+        file_path.unlink(missing_ok=True)
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+def _queue_uploaded_document(filename: str, file_path: Path) -> Dict:
+    """Create the database record for a saved upload and queue it for processing."""
+    # Create database record
+    with app.state.search_service.engine.connect() as conn:
+        result = conn.execute(
+            text("""
+                INSERT INTO documents (file_name, file_path, processing_status, created_at)
+                VALUES (:file_name, :file_path, 'queued', NOW())
+                RETURNING id
+            """),
+            {"file_name": filename, "file_path": str(file_path)}
+        )
+        conn.commit()
+        document_id = result.fetchone()[0]
+
+    # Queue task for processing (distributed to Celery workers)
+    task = process_document_task.delay(document_id, str(file_path))
+
+    return {
+        "document_id": document_id,
+        "task_id": task.id,
+        "status": "queued",
+        "message": "Document queued for processing. Check status with task_id."
+    }
+
+
 @app.post("/api/batch-upload", tags=["Upload"])
 async def batch_upload(files: List[UploadFile] = File(...)):
     """
@@ -1168,55 +1629,65 @@ async def batch_upload(files: List[UploadFile] = File(...)):
     """
     try:
         batch_id = str(uuid.uuid4())
-        upload_dir = Path("uploads")
-        upload_dir.mkdir(exist_ok=True)
 
         document_ids = []
-        task_ids = []
-
-        # Save all files and create database records
-        with app.state.search_service.engine.connect() as conn:
-            for file in files:
-                file_id = str(uuid.uuid4())
-                file_path = upload_dir / f"{file_id}_{file.filename}"
-
-                # Save file
-                with open(file_path, "wb") as buffer:
-                    shutil.copyfileobj(file.file, buffer)
-
-                # Create database record
+        document_paths = []
+        failed_files = []
+
+        # Save all files concurrently
+        uploads = [
+            (file, UPLOAD_DIR / f"{uuid.uuid4()}_{file.filename}")
+            for file in files
+        ]
+        outcomes = await _save_uploads(uploads)
+
+        saved = []
+        for (file, file_path), outcome in zip(uploads, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to save {file.filename}: {outcome}")
+                failed_files.append({"filename": file.filename, "error": str(outcome)})
+                continue
+            saved.append((file.filename, str(file_path)))
+
+        # Create database records for the files that were saved, in one
+        # statement instead of one round-trip per file
+        if saved:
+            file_names, file_paths = (list(column) for column in zip(*saved))
+            with app.state.search_service.engine.connect() as conn:
                 result = conn.execute(
                     text("""
                         INSERT INTO documents (file_name, file_path, processing_status, batch_id, created_at)
-                        VALUES (:file_name, :file_path, 'queued', :batch_id, NOW())
-                        RETURNING id
+                        SELECT file_name, file_path, 'queued', :batch_id, NOW()
+                        FROM unnest(CAST(:file_names AS text[]), CAST(:file_paths AS text[]))
+                            AS uploaded(file_name, file_path)
+                        RETURNING id, file_path
                     """),
                     {
-                        "file_name": file.filename,
-                        "file_path": str(file_path),
+                        "file_names": file_names,
+                        "file_paths": file_paths,
                         "batch_id": batch_id
                     }
                 )
-                document_id = result.fetchone()[0]
-                document_ids.append(document_id)
-
-            conn.commit()
+                for document_id, document_path in result:
+                    document_ids.append(document_id)
+                    document_paths.append(document_path)
+                conn.commit()
 
         # Queue all tasks in parallel (Celery distributes across workers)
-        from celery import group
         job = group([
-            process_document_task.s(doc_id, str(upload_dir / f"*{doc_id}*"))
-            for doc_id in document_ids
+            process_document_task.s(doc_id, doc_path)
+            for doc_id, doc_path in zip(document_ids, document_paths)
         ])
         result = job.apply_async()
 
         return {
             "batch_id": batch_id,
-            "document_count": len(files),
+            "document_count": len(document_ids),
             "document_ids": document_ids,
+            "failed_files": failed_files,
             "group_id": result.id,
             "status": "queued",
-            "message": f"{len(files)} documents queued for parallel processing"
+            "message": f"{len(document_ids)} documents queued for parallel processing"
         }
 
     except Exception as e:
@@ -1259,27 +1730,39 @@ async def get_batch_status(batch_id: str):
     """
     try:
         with app.state.search_service.engine.connect() as conn:
-            # Get all documents in batch
-            result = conn.execute(
+            # Count documents per status in the database (one aggregate row
+            # per status) instead of fetching and rescanning the whole batch
+            status_counts = dict(conn.execute(
+                text("""
+                    SELECT processing_status, COUNT(*)
+                    FROM documents
+                    WHERE batch_id = :batch_id
+                    GROUP BY processing_status
+                """),
+                {"batch_id": batch_id}
+            ).fetchall())
+
+            # Only the first 100 documents are returned
+            docs = conn.execute(
                 text("""
                     SELECT id, file_name, processing_status, category, error_message
                     FROM documents
                     WHERE batch_id = :batch_id
                     ORDER BY created_at
+                    LIMIT 100
                 """),
                 {"batch_id": batch_id}
-            )
-            docs = result.fetchall()
+            ).fetchall()
 
-        if not docs:
+        if not status_counts:
             raise HTTPException(status_code=404, detail="Batch not found")
 
         # Calculate statistics
-        total = len(docs)
-        completed = sum(1 for d in docs if d[2] == 'completed')
-        processing = sum(1 for d in docs if d[2] == 'processing')
-        queued = sum(1 for d in docs if d[2] == 'queued')
-        failed = sum(1 for d in docs if d[2] == 'failed')
+        total = sum(status_counts.values())
+        completed = status_counts.get('completed', 0)
+        processing = status_counts.get('processing', 0)
+        queued = status_counts.get('queued', 0)
+        failed = status_counts.get('failed', 0)
 
         return {
             "batch_id": batch_id,
@@ -1298,7 +1781,7 @@ async def get_batch_status(batch_id: str):
                     "category": d[3],
                     "error": d[4]
                 }
-                for d in docs[:100]  # Limit to first 100 for performance
+                for d in docs
             ]
         }
 
@@ -1366,10 +1849,26 @@ if __name__ == "__main__":
     import uvicorn
 
     # Run with: python -m api.main
+    #
+    # uvloop + httptools come with uvicorn[standard]; naming them explicitly
+    # makes a missing install fail loudly instead of silently falling back to
+    # the slower asyncio loop and h11 parser.
+    #
+    # API_WORKERS defaults to 1: batch progress and WebSocket subscribers live
+    # in process memory unless BATCH_PROGRESS_REDIS_URL is set, so without it
+    # extra workers would each see only their own batches. Reload
+    # (development) only works with a single worker.
+    workers = int(os.getenv("API_WORKERS", "1"))
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
-        port=8000,
-        reload=True,  # Auto-reload on code changes
+        port=int(os.getenv("API_PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        # WebSocket keepalive via protocol ping/pong frames
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
+        workers=workers,
+        reload=workers == 1 and os.getenv("API_RELOAD", "true").lower() == "true",
         log_level="info"
     )
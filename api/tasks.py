@@ -6,24 +6,28 @@ Supports processing 500K+ documents with horizontal scaling.
 """
 
 from celery import Celery, Task
+from kombu import Exchange, Queue
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
-import json
+import os
 
 from config import settings
 from src.classifier import DocumentClassifier
 from src.metadata_extractor import MetadataExtractor
 from src.search_service import SearchService
 from src.database import Database
+from src.celery_serialization import celery_serializer_settings
+from src.json_utils import dumps
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
 # ============================================================================
 # CELERY CONFIGURATION
 # ============================================================================
@@ -36,10 +40,8 @@ celery_app = Celery(
 
 # Celery settings optimized for high throughput
 celery_app.conf.update(
-    # Serialization
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # Serialization (orjson when installed, stdlib json otherwise)
+    **celery_serializer_settings(),
     result_expires=3600,  # Results expire after 1 hour
 
     # Time zone
@@ -48,7 +50,9 @@ celery_app.conf.update(
 
     # Performance
     task_acks_late=True,  # Don't lose tasks if worker crashes
-    worker_prefetch_multiplier=4,  # Fetch 4 tasks at a time per worker
+    # Tasks fetched ahead per worker process; raise it (e.g. CELERY_PREFETCH_MULTIPLIER=16)
+    # for many short tasks, keep it low when tasks are long-running LLM calls
+    worker_prefetch_multiplier=int(os.getenv('CELERY_PREFETCH_MULTIPLIER', '4')),
     task_time_limit=600,  # 10 minutes hard limit
     task_soft_time_limit=540,  # 9 minutes soft limit
 
@@ -56,6 +60,19 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,
     task_acks_on_failure_or_timeout=True,
 
+    # Broker connection: keepalive + periodic PING so idle or busy workers
+    # don't lose the Redis socket, and reconnects retry with backoff.
+    # Prefetched (unacked, acks_late) messages are redelivered after
+    # visibility_timeout, so keep it above prefetch * longest task time.
+    broker_connection_retry_on_startup=True,
+    broker_connection_max_retries=None,
+    broker_transport_options={
+        'visibility_timeout': int(os.getenv('CELERY_VISIBILITY_TIMEOUT', '3600')),
+        'socket_keepalive': True,
+        'health_check_interval': 30,
+        'retry_on_timeout': True,
+    },
+
     # Worker
     worker_max_tasks_per_child=100,  # Restart worker after 100 tasks (prevent memory leaks)
     worker_disable_rate_limits=True,  # Max performance
@@ -64,6 +81,19 @@ celery_app.conf.update(
     result_backend_transport_options={
         'master_name': 'mymaster'
     },
+
+    # Routing: per-document tasks get their own direct-bound queue, so the
+    # rare batch/maintenance tasks never wait behind a 500K-document backlog.
+    # Workers consume every queue listed here unless started with -Q.
+    task_queues=(
+        Queue('documents', Exchange('documents', type='direct'), routing_key='documents'),
+        Queue('batches', Exchange('batches', type='direct'), routing_key='batches'),
+    ),
+    task_default_queue='documents',
+    task_routes={
+        'api.tasks.process_batch_task': {'queue': 'batches'},
+        'api.tasks.cleanup_old_results_task': {'queue': 'batches'},
+    },
 )
 
 # ============================================================================
@@ -127,10 +157,10 @@ def process_document_task(self, document_id: int, file_path: str) -> Dict[str, A
             UPDATE documents
             SET category = %s,
                 confidence = %s,
-                updated_at = NOW()
+                updated_at = %s
             WHERE id = %s
             """,
-            (category, confidence, document_id)
+            (category, confidence, datetime.now(timezone.utc), document_id)
         )
 
         # Step 2: Extract metadata
@@ -145,10 +175,10 @@ def process_document_task(self, document_id: int, file_path: str) -> Dict[str, A
             """
             UPDATE documents
             SET metadata = %s,
-                updated_at = NOW()
+                updated_at = %s
             WHERE id = %s
             """,
-            (json.dumps(metadata), document_id)
+            (dumps(metadata, default=str), datetime.now(timezone.utc), document_id)
         )
 
         # Step 3: Index to search (OpenSearch + vector embeddings)
@@ -172,17 +202,20 @@ def process_document_task(self, document_id: int, file_path: str) -> Dict[str, A
 
         logger.info(f"[{document_id}] Indexed to search")
 
-        # Update final status
+        # Update final status. Stamped now, not when the task started
+        # (classify + extract + index can take minutes); one value for both
+        # columns so indexed_at and updated_at agree.
+        completed_at = datetime.now(timezone.utc)
         db.execute_query(
             """
             UPDATE documents
             SET processing_status = 'completed',
                 indexed = TRUE,
-                indexed_at = NOW(),
-                updated_at = NOW()
+                indexed_at = %s,
+                updated_at = %s
             WHERE id = %s
             """,
-            (document_id,)
+            (completed_at, completed_at, document_id)
         )
 
         logger.info(f"[{document_id}] ✅ Processing completed successfully")
@@ -205,10 +238,10 @@ def process_document_task(self, document_id: int, file_path: str) -> Dict[str, A
             SET processing_status = 'failed',
                 error_message = %s,
                 retry_count = retry_count + 1,
-                updated_at = NOW()
+                updated_at = %s
             WHERE id = %s
             """,
-            (str(e), document_id)
+            (str(e), datetime.now(timezone.utc), document_id)
         )
 
         # Retry task if not exceeded max retries
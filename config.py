@@ -92,7 +92,7 @@ USAGE EXAMPLE:
 
     # Access settings
     print(settings.ollama_model)  # "llama3.2:3b"
-    print(settings.category_list)  # ["invoices", "contracts", ...]
+    print(settings.category_list)  # ("invoices", "contracts", ...)
 
     # Settings are type-safe
     if settings.use_database:
@@ -124,11 +124,37 @@ AUTHOR: AI Document Pipeline Team
 LAST UPDATED: October 2025
 """
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List, Tuple
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# ==============================================================================
+# HELPERS
+# ==============================================================================
+
+@lru_cache(maxsize=32)
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated setting into stripped, interned items, once per value.
+
+    Keyed on the string itself rather than cached on the Settings instance,
+    so a value reassigned at runtime (the CLI overrides categories) is
+    re-split instead of returning a stale list. Interning lets the repeated
+    category comparisons and dict lookups short-circuit on identity.
+    """
+    return tuple(sys.intern(item.strip()) for item in value.split(","))
+
+
+@lru_cache(maxsize=32)
+def _category_set(value: str) -> FrozenSet[str]:
+    """Frozenset of the split categories, cached per value like _split_csv."""
+    return frozenset(_split_csv(value))
+
+
 # ==============================================================================
 # SETTINGS CLASS (Application Configuration)
 # ==============================================================================
@@ -165,7 +191,7 @@ class Settings(BaseSettings):
         >>> print(settings.ollama_model)
         llama3.2:3b
         >>> print(settings.category_list)
-        ['invoices', 'contracts', 'reports', ...]
+        ('invoices', 'contracts', 'reports', ...)
 
     Why BaseSettings?
         - Loads from environment automatically
@@ -196,6 +222,22 @@ class Settings(BaseSettings):
         - Check with: ollama list
     """
 
+    ollama_hosts: str = ""
+    """
+    Additional Ollama URLs to spread LLM requests across (comma-separated).
+
+    Default: "" (use ollama_host only)
+
+    Examples:
+        Two GPU boxes:
+            http://gpu1:11434,http://gpu2:11434
+
+    Why needed?
+        - One Ollama instance is limited by its GPU, even with OLLAMA_NUM_PARALLEL
+        - Requests are round-robined across hosts
+        - A host that keeps failing is skipped for a cool-down period
+    """
+
     ollama_model: str = "llama3.2:3b"
     """
     Ollama model name for classification.
@@ -312,7 +354,7 @@ class Settings(BaseSettings):
     Why string (not list)?
         - Environment variables are strings
         - Easy to set: export CATEGORIES="cat1,cat2,cat3"
-        - Converted to list by category_list property
+        - Converted to tuple by category_list property
     """
 
     # ==========================================================================
@@ -394,6 +436,26 @@ class Settings(BaseSettings):
     Note: Not fully implemented in current version
     """
 
+    batch_progress_redis_url: str = ""
+    """
+    Redis URL for sharing batch upload progress between API workers.
+
+    Default: "" (progress kept in the API process's memory)
+
+    Examples:
+        Local Redis:
+            redis://localhost:6379/1
+        Docker Compose:
+            redis://redis:6379/1
+
+    Why needed?
+        - Without it, a WebSocket or progress poll that lands on a different
+          API worker than the upload sees "Batch ID not found"
+        - Progress is stored with a 1 hour expiry and updates are published
+          over pub/sub, so any worker can stream them
+        - Required when running with API_WORKERS > 1 or several API pods
+    """
+
     # ==========================================================================
     # LOGGING CONFIGURATION
     # ==========================================================================
@@ -815,17 +877,23 @@ class Settings(BaseSettings):
     # ==========================================================================
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=".env" if os.path.isfile(".env") else None,
         env_file_encoding="utf-8",
-        case_sensitive=False
+        case_sensitive=False,
+        validate_default=False
     )
     """
     Pydantic settings configuration.
 
     What this does:
-        - env_file: Load from .env file
+        - env_file: Load from .env file (None when there is no .env, e.g.
+          in Docker where everything comes from the environment, so no
+          file lookup happens when settings are built)
         - env_file_encoding: UTF-8 encoding
         - case_sensitive: False (OLLAMA_HOST = ollama_host)
+        - validate_default: False (only values from the environment/.env
+          are validated; the literal defaults above are already the right
+          type, so re-validating all 30 of them on every startup is wasted work)
 
     This tells Pydantic:
         1. Look for .env file in current directory
@@ -839,15 +907,15 @@ class Settings(BaseSettings):
     # ==========================================================================
 
     @property
-    def category_list(self) -> List[str]:
+    def category_list(self) -> Tuple[str, ...]:
         """
-        Return categories as a list.
+        Return categories as a tuple.
 
-        Converts comma-separated string to list:
-            "invoices,contracts,reports" → ["invoices", "contracts", "reports"]
+        Converts comma-separated string to tuple:
+            "invoices,contracts,reports" → ("invoices", "contracts", "reports")
 
         Returns:
-            List of category strings
+            Tuple of category strings (cached per value, so treat as read-only)
 
         Why a property?
             - Environment variables are strings
@@ -859,9 +927,21 @@ class Settings(BaseSettings):
             >>> settings.categories
             "invoices,contracts,reports"
             >>> settings.category_list
-            ["invoices", "contracts", "reports"]
+            ("invoices", "contracts", "reports")
+        """
+        # Split once per distinct value; the same tuple is shared by every caller
+        return _split_csv(self.categories)
+
+    @property
+    def category_set(self) -> FrozenSet[str]:
+        """
+        Return categories as a frozenset for O(1) membership checks.
+
+        Usage:
+            >>> "invoices" in settings.category_set
+            True
         """
-        return [cat.strip() for cat in self.categories.split(",")]
+        return _category_set(self.categories)
 
     @property
     def opensearch_hosts_list(self) -> List[str]:
@@ -880,7 +960,26 @@ class Settings(BaseSettings):
             >>> settings.opensearch_hosts_list
             ["http://localhost:9200"]
         """
-        return [host.strip() for host in self.opensearch_hosts.split(",")]
+        return list(_split_csv(self.opensearch_hosts))
+
+    @property
+    def ollama_hosts_list(self) -> List[str]:
+        """
+        Return Ollama hosts as a list.
+
+        Falls back to ollama_host when ollama_hosts is empty:
+            "" → ["http://localhost:11434"]
+            "http://gpu1:11434,http://gpu2:11434" → ["http://gpu1:11434", "http://gpu2:11434"]
+
+        Returns:
+            List of host URLs
+
+        Usage:
+            >>> settings.ollama_hosts_list
+            ["http://localhost:11434"]
+        """
+        hosts = [host.strip() for host in self.ollama_hosts.split(",") if host.strip()]
+        return hosts or [self.ollama_host]
 
     @property
     def max_file_size_bytes(self) -> int:
@@ -908,7 +1007,7 @@ class Settings(BaseSettings):
             >>> if file_size > settings.max_file_size_bytes:
             ...     skip_file()
         """
-        return self.max_file_size_mb * 1024 * 1024
+        return self.max_file_size_mb << 20  # MB -> bytes (* 1024 * 1024)
 
     # ==========================================================================
     # UTILITY METHODS
@@ -939,15 +1038,23 @@ class Settings(BaseSettings):
             >>> settings.ensure_directories()
             >>> # Now all folders exist and are ready
         """
-        # Create main folders
-        self.input_folder.mkdir(parents=True, exist_ok=True)
-        self.output_folder.mkdir(parents=True, exist_ok=True)
-        self.temp_folder.mkdir(parents=True, exist_ok=True)
+        # Create main folders (one stat each; mkdir only when missing).
+        # Plain os calls on the str path: no Path objects are built here,
+        # and a folder overridden with a str works the same as a Path.
+        for folder in (self.input_folder, self.output_folder, self.temp_folder):
+            folder = os.fspath(folder)
+            if not os.path.isdir(folder):
+                os.makedirs(folder, exist_ok=True)
 
         # Create category folders in output directory
         # This prepares folders for DocumentOrganizer
+        # One directory listing instead of a stat + mkdir per category
+        output_folder = os.fspath(self.output_folder)
+        with os.scandir(output_folder) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
         for category in self.category_list:
-            (self.output_folder / category).mkdir(parents=True, exist_ok=True)
+            if category not in existing:
+                os.makedirs(os.path.join(output_folder, category), exist_ok=True)
 
 
 # ==============================================================================
@@ -0,0 +1,22 @@
+-- ==============================================================================
+-- MIGRATION: Composite index for category listings
+-- ==============================================================================
+--
+-- ISSUE: Category pages and filtered searches run
+--     WHERE category = :category ORDER BY processed_date DESC LIMIT :n
+-- With separate single-column indexes the planner filters on one index and
+-- then sorts every matching row.
+--
+-- FIX: One (category, processed_date DESC) index serves both the filter and
+-- the order, so the query reads only the first :n index entries. It also
+-- covers plain category lookups, making idx_documents_category redundant.
+--
+-- SAFETY: CONCURRENTLY builds the index without blocking writes (cannot run
+-- inside a transaction block).
+--
+-- ==============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_category_processed_date
+    ON documents (category, processed_date DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_documents_category;
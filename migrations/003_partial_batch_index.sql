@@ -0,0 +1,34 @@
+-- ==============================================================================
+-- MIGRATION: Partial index for batch upload lookups
+-- ==============================================================================
+--
+-- ISSUE: /api/batch-status/{batch_id} runs
+--     WHERE batch_id = :batch_id GROUP BY processing_status
+--     WHERE batch_id = :batch_id ORDER BY created_at LIMIT 100
+-- on a table holding every document, most of which were never part of an
+-- API batch (CLI / directory runs leave batch_id NULL).
+--
+-- FIX: A partial index covering only rows with a batch_id. It stays as small
+-- as the batch-uploaded set, serves both the filter and the ORDER BY, and
+-- non-batch inserts never touch it.
+--
+-- SAFETY: batch_id and created_at come from the API upload schema, not
+-- 001_init_search.sql, so the index is only created where they exist.
+--
+-- ==============================================================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'documents' AND column_name = 'batch_id'
+    ) AND EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'documents' AND column_name = 'created_at'
+    ) THEN
+        EXECUTE 'CREATE INDEX IF NOT EXISTS idx_documents_batch_created
+                 ON documents (batch_id, created_at)
+                 WHERE batch_id IS NOT NULL';
+    END IF;
+END
+$$;
@@ -0,0 +1,19 @@
+-- ==============================================================================
+-- MIGRATION: GIN index on metadata_json
+-- ==============================================================================
+--
+-- ISSUE: Filtering on extracted business metadata (vendor, invoice number,
+-- PO number, ...) has to read and scan metadata_json for every row.
+--
+-- FIX: A GIN index with jsonb_path_ops turns containment filters such as
+--     WHERE metadata_json @> '{"vendor": "Acme"}'
+-- into index lookups. jsonb_path_ops only supports @>, but the index is
+-- much smaller and cheaper to maintain on insert than the default class.
+--
+-- SAFETY: CONCURRENTLY builds the index without blocking writes (cannot run
+-- inside a transaction block).
+--
+-- ==============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_metadata_gin
+    ON documents USING GIN (metadata_json jsonb_path_ops);
@@ -0,0 +1,47 @@
+-- ==============================================================================
+-- MIGRATION: Store processing_status as an ENUM
+-- ==============================================================================
+--
+-- ISSUE: processing_status holds one of four fixed values but is stored as
+-- text, so every row and every index entry carries the full string and
+-- comparisons are string comparisons.
+--
+-- FIX: A PostgreSQL ENUM is stored as a 4-byte OID and compared as an
+-- integer. Queries keep using the string literals ('queued', 'completed',
+-- ...); PostgreSQL casts them to the enum, so no application change is
+-- needed.
+--
+-- Values written by the API and workers:
+--   queued      - /api/upload and /api/batch-upload
+--   processing  - worker picked the document up
+--   completed   - classified, extracted and indexed
+--   failed      - gave up after retries
+-- 'pending' is included for rows created by older versions.
+--
+-- SAFETY: processing_status comes from the API upload schema, not
+-- 001_init_search.sql, so the column is only converted where it exists.
+-- ALTER ... TYPE rewrites the table and takes an exclusive lock; run it in
+-- a maintenance window on large tables.
+--
+-- ==============================================================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'document_processing_status') THEN
+        CREATE TYPE document_processing_status AS ENUM (
+            'pending', 'queued', 'processing', 'completed', 'failed'
+        );
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'documents'
+          AND column_name = 'processing_status'
+          AND data_type <> 'USER-DEFINED'
+    ) THEN
+        ALTER TABLE documents
+            ALTER COLUMN processing_status TYPE document_processing_status
+            USING processing_status::document_processing_status;
+    END IF;
+END
+$$;
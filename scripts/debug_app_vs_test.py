@@ -21,6 +21,9 @@ from src.embedding_service import OllamaEmbeddingService
 from src.search_service import SearchService, SearchMode
 import numpy as np
 
+# One pooled keep-alive session for every request (no reconnect per call)
+http = requests.Session()
+
 
 def test_app_api(base_url="http://localhost:8000"):
     """Test the actual API running on localhost."""
@@ -47,7 +50,7 @@ def test_app_api(base_url="http://localhost:8000"):
                     "limit": 5
                 }
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = http.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -148,7 +151,7 @@ def check_app_status():
     
     for endpoint in endpoints_to_check:
         try:
-            response = requests.get(endpoint, timeout=5)
+            response = http.get(endpoint, timeout=5)
             print(f"✅ {endpoint}: Status {response.status_code}")
         except requests.exceptions.ConnectionError:
             print(f"❌ {endpoint}: Connection refused (not running?)")
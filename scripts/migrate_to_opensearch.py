@@ -77,7 +77,7 @@ import sys
 import time
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -93,9 +93,69 @@ from config import settings
 from src.opensearch_service import OpenSearchService
 from src.embedding_service import EmbeddingService, EmbeddingProvider
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 console = Console()
 
 
+def parse_pgvector(value: str) -> Optional[List[float]]:
+    """
+    Parse a pgvector string ("[0.1,0.2,...]") into a list of floats.
+
+    All-zero vectors are dropped (returned as None): OpenSearch's cosinesimil
+    space cannot score them, so the document is indexed without an embedding.
+    """
+    if NUMPY_AVAILABLE:
+        # Vectorized parse and zero check instead of per-element Python
+        try:
+            vector = np.array(value.strip("[]").split(","), dtype=np.float64)
+        except ValueError:
+            return None
+        return vector.tolist() if vector.any() else None
+
+    try:
+        vector = json.loads(value)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return vector if any(vector) else None
+
+
+def parse_pgvector_batch(values: List[Any]) -> List[Any]:
+    """
+    Parse a batch of embedding column values, aligned with the input.
+
+    pgvector strings are parsed as in parse_pgvector; anything else (None,
+    an already-decoded list) is returned unchanged. With NumPy, a batch of
+    same-dimension vectors is converted as one (N, D) array and zero
+    vectors are found with a single any(axis=1) reduction.
+    """
+    parsed = list(values)
+    indices = [i for i, v in enumerate(values) if v and isinstance(v, str)]
+    if not indices:
+        return parsed
+
+    if NUMPY_AVAILABLE:
+        tokens = [values[i].strip("[]").split(",") for i in indices]
+        if len({len(t) for t in tokens}) == 1:
+            try:
+                matrix = np.array(tokens, dtype=np.float64)
+            except ValueError:
+                matrix = None  # A malformed row; parse one by one below
+            if matrix is not None:
+                nonzero = matrix.any(axis=1)
+                for i, vector, keep in zip(indices, matrix.tolist(), nonzero):
+                    parsed[i] = vector if keep else None
+                return parsed
+
+    for i in indices:
+        parsed[i] = parse_pgvector(values[i])
+    return parsed
+
+
 def fetch_documents_from_postgres(
     database_url: str,
     batch_size: int = 1000
@@ -121,8 +181,10 @@ def fetch_documents_from_postgres(
 
             console.print(f"📊 Found {total:,} documents in PostgreSQL\n")
 
-            # Fetch in batches
-            offset = 0
+            # Fetch in batches using keyset pagination (WHERE id > last id):
+            # each page is an index range scan on the primary key, whereas
+            # OFFSET re-reads and discards every earlier row on each page
+            last_id = 0
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -133,7 +195,7 @@ def fetch_documents_from_postgres(
             ) as progress:
                 task = progress.add_task("Fetching documents...", total=total)
 
-                while offset < total:
+                while True:
                     sql = text("""
                         SELECT
                             id, file_name, file_path, category,
@@ -143,24 +205,22 @@ def fetch_documents_from_postgres(
                             confidence,
                             embedding, metadata_json
                         FROM documents
+                        WHERE id > :last_id
                         ORDER BY id
-                        LIMIT :limit OFFSET :offset
+                        LIMIT :limit
                     """)
 
-                    result = conn.execute(sql, {"limit": batch_size, "offset": offset})
+                    result = conn.execute(sql, {"limit": batch_size, "last_id": last_id})
                     rows = result.fetchall()
+                    if not rows:
+                        break
+                    last_id = rows[-1][0]
 
-                    for row in rows:
-                        # Parse embedding from pgvector string format to list
-                        embedding = row[15]
-                        if embedding and isinstance(embedding, str):
-                            # pgvector returns embeddings as string like "[0.1,0.2,0.3,...]"
-                            try:
-                                embedding = json.loads(embedding)
-                            except (json.JSONDecodeError, ValueError):
-                                # If it fails, try parsing as Python literal
-                                embedding = None
+                    # pgvector returns embeddings as strings like "[0.1,0.2,0.3,...]";
+                    # parse the whole batch at once
+                    embeddings = parse_pgvector_batch([row[15] for row in rows])
 
+                    for row, embedding in zip(rows, embeddings):
                         # Parse confidence - convert string to None if not a number
                         confidence = row[14]
                         if confidence and isinstance(confidence, str):
@@ -191,7 +251,6 @@ def fetch_documents_from_postgres(
                         }
                         documents.append(doc)
 
-                    offset += batch_size
                     progress.update(task, advance=len(rows))
 
         return documents
@@ -269,12 +328,17 @@ def verify_migration(
         # Refresh index to make documents searchable
         opensearch_service.refresh_index(index_name)
 
-        # Get index stats
-        stats = opensearch_service.get_index_stats(index_name)
-        actual_count = stats.get("document_count", 0)
+        # Count server-side; only the totals come back, not documents
+        actual_count = opensearch_service.count_documents(index_name)
 
         if actual_count == expected_count:
             console.print(f"[green]✓ Verified: {actual_count:,} documents in OpenSearch[/green]")
+            stats = opensearch_service.get_index_stats(index_name)
+            if stats:
+                console.print(
+                    f"   {stats['documents_with_embeddings']:,} with embeddings "
+                    f"({stats['embedding_coverage']})"
+                )
             return True
         else:
             console.print(f"[yellow]⚠️  Count mismatch: Expected {expected_count:,}, found {actual_count:,}[/yellow]")
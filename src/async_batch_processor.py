@@ -88,16 +88,16 @@ USAGE EXAMPLE:
 
     async def main():
         # Create processor with 50 concurrent tasks
-        processor = AsyncBatchProcessor(
+        # ("async with" shuts its thread pools down when done)
+        async with AsyncBatchProcessor(
             max_concurrent=50,
             batch_size=100,  # Insert 100 docs at once to DB
             use_database=True
-        )
-
-        # Process all documents
-        stats = await processor.process_directory_async(
-            Path("documents/input")
-        )
+        ) as processor:
+            # Process all documents
+            stats = await processor.process_directory_async(
+                Path("documents/input")
+            )
 
         print(f"Processed {stats.successful} documents")
         print(f"Speed: {stats.documents_per_second:.1f} docs/sec")
@@ -116,6 +116,7 @@ LAST UPDATED: October 2025
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Set
 from dataclasses import dataclass, field
@@ -124,6 +125,8 @@ import hashlib
 from loguru import logger
 
 from src.extractors import ExtractionService, ExtractedContent
+from src.file_scanner import scan_documents
+from src.json_utils import write_json
 from src.ollama_service import OllamaService
 from config import settings
 
@@ -295,16 +298,15 @@ class AsyncBatchProcessor:
         from pathlib import Path
 
         async def process_documents():
-            processor = AsyncBatchProcessor(
+            async with AsyncBatchProcessor(
                 max_concurrent=50,
                 batch_size=100,
                 use_database=True,
                 deduplicate=True  # Skip already-processed
-            )
-
-            stats = await processor.process_directory_async(
-                Path("documents/input")
-            )
+            ) as processor:
+                stats = await processor.process_directory_async(
+                    Path("documents/input")
+                )
 
             print(f"Success: {stats.successful}")
             print(f"Failed: {stats.failed}")
@@ -394,6 +396,22 @@ class AsyncBatchProcessor:
         self.processed_hashes: Set[str] = set()             # For deduplication
         self.pending_db_batch: List[Dict[str, Any]] = []   # Pending DB inserts
 
+        # Dedicated single thread for database writes: flushes run one at a
+        # time and never take threads from the default pool that extraction
+        # and classification use
+        self.db_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+            if self.use_database else None
+        )
+
+        # Threads for Ollama calls, one per allowed concurrent document.
+        # OllamaService is a blocking client, so each in-flight request holds
+        # a thread; the default pool (min(32, CPUs + 4) threads, shared with
+        # extraction) would silently cap concurrency below max_concurrent.
+        self.ollama_executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="ollama"
+        )
+
         # Step 6: Create semaphore for concurrency control
         #
         # What's a semaphore?
@@ -410,6 +428,37 @@ class AsyncBatchProcessor:
 
         logger.info(f"Initialized AsyncBatchProcessor: max_concurrent={max_concurrent}, batch_size={batch_size}")
 
+    # ==========================================================================
+    # LIFECYCLE METHODS
+    # ==========================================================================
+
+    def close(self):
+        """
+        Shut down the processor's thread pools.
+
+        Each processor owns its Ollama and database executors. Without
+        close() their idle (non-daemon) threads stay alive after the
+        processor is done - one set per processor created, e.g. per
+        API or Celery batch.
+
+        Prefer using the processor as an async context manager:
+            >>> async with AsyncBatchProcessor(max_concurrent=50) as processor:
+            ...     stats = await processor.process_directory_async(Path("docs"))
+
+        Don't process more batches after closing.
+        """
+        self.ollama_executor.shutdown(wait=True)
+        if self.db_executor is not None:
+            self.db_executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncBatchProcessor":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # close() waits for in-flight Ollama calls and DB writes; wait in a
+        # worker thread so the event loop keeps running meanwhile
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
     # ==========================================================================
     # DEDUPLICATION METHODS
     # ==========================================================================
@@ -437,9 +486,10 @@ class AsyncBatchProcessor:
         - 256 bits = 64 hex characters
 
         How it works:
-        1. Read file in 8KB chunks (efficient for large files)
-        2. Update hash with each chunk
-        3. Return final hash
+        1. hashlib.file_digest streams the file through the hasher in
+           large chunks (it reads straight into a reusable buffer, with
+           no per-chunk bytes objects)
+        2. Return final hash
 
         Example:
             >>> _calculate_file_hash(Path("invoice.pdf"))
@@ -450,15 +500,10 @@ class AsyncBatchProcessor:
             'a3f5d8c9e2b1...'  # Identical!
         """
         try:
-            # Create SHA256 hasher
-            sha256 = hashlib.sha256()
-
-            # Read file in chunks (efficient for large files)
+            # Stream the file through SHA256
+            # This never loads huge files entirely into memory
             with open(file_path, 'rb') as f:
-                # Read 8KB at a time
-                # This prevents loading huge files entirely into memory
-                for chunk in iter(lambda: f.read(8192), b''):
-                    sha256.update(chunk)
+                sha256 = hashlib.file_digest(f, 'sha256')
 
             # Return hex string (64 characters)
             return sha256.hexdigest()
@@ -570,7 +615,8 @@ class AsyncBatchProcessor:
             Total: 3x longer!
         """
         # Record start time for performance tracking
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
         # Acquire semaphore (wait if too many tasks running)
         #
@@ -586,7 +632,7 @@ class AsyncBatchProcessor:
                 # If we've already processed this document, skip it.
                 # This saves time and prevents duplicate database entries.
                 if self._is_duplicate(file_path):
-                    logger.debug(f"Skipping duplicate: {file_path.name}")
+                    logger.debug("Skipping duplicate: {}", file_path.name)
                     return AsyncBatchResult(
                         file_path=file_path,
                         category="",
@@ -605,7 +651,6 @@ class AsyncBatchProcessor:
                 # Think of it as:
                 # "Hey thread pool, run this blocking function for me
                 #  while I do other async stuff"
-                loop = asyncio.get_event_loop()
                 extracted = await loop.run_in_executor(
                     None,                      # Use default thread pool
                     self.extractor.extract,    # Function to run
@@ -623,14 +668,15 @@ class AsyncBatchProcessor:
 
                 # Step 4: Classify the document using AI
                 #
-                # Again using run_in_executor because Ollama service is synchronous.
+                # Again using run_in_executor because Ollama service is synchronous,
+                # on self.ollama_executor so every concurrent task gets a thread.
                 # We have two classification modes:
                 # - With reasoning: Returns category + AI's explanation
                 # - Without reasoning: Just returns category (faster)
                 if include_reasoning:
                     # Classification with reasoning (detailed)
                     classification = await loop.run_in_executor(
-                        None,
+                        self.ollama_executor,
                         self.ollama.classify_with_confidence,
                         extracted.text,
                         extracted.metadata.to_dict(),
@@ -651,7 +697,7 @@ class AsyncBatchProcessor:
                 else:
                     # Classification without reasoning (faster)
                     category = await loop.run_in_executor(
-                        None,
+                        self.ollama_executor,
                         self.ollama.classify_document,
                         extracted.text,
                         extracted.metadata.to_dict(),
@@ -668,7 +714,7 @@ class AsyncBatchProcessor:
                         )
 
                 # Step 5: Calculate processing time
-                processing_time = asyncio.get_event_loop().time() - start_time
+                processing_time = loop.time() - start_time
 
                 # Step 6: Mark as processed (for deduplication)
                 file_hash = self._calculate_file_hash(file_path)
@@ -706,7 +752,7 @@ class AsyncBatchProcessor:
 
             except Exception as e:
                 # Something went wrong - log and return error
-                processing_time = asyncio.get_event_loop().time() - start_time
+                processing_time = loop.time() - start_time
                 logger.error(f"Async classification error for {file_path}: {e}")
                 return AsyncBatchResult(
                     file_path=file_path,
@@ -736,9 +782,8 @@ class AsyncBatchProcessor:
 
         How it works:
         1. Check if there are pending documents
-        2. Copy the batch (so we can clear it immediately)
-        3. Run batch insert in executor (don't block async loop)
-        4. Clear the pending batch
+        2. Take the batch and start a new empty one
+        3. Run batch insert in the database executor (don't block async loop)
 
         Why run_in_executor?
         - Database operations are synchronous (blocking)
@@ -753,20 +798,19 @@ class AsyncBatchProcessor:
         try:
             # Run batch insert in executor (non-blocking)
             #
-            # Why copy the batch?
-            # - We pass batch.copy() to the executor
-            # - This lets us clear pending_db_batch immediately
-            # - Other tasks can start building a new batch
-            # - Executor works on the copy independently
-            loop = asyncio.get_event_loop()
+            # Why swap the list before awaiting?
+            # - Other tasks keep appending while the insert runs
+            # - Taking the batch and installing a fresh list first means
+            #   nothing appended during the await is cleared unflushed
+            batch, self.pending_db_batch = self.pending_db_batch, []
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
-                None,
+                self.db_executor,
                 self._batch_insert_to_db,
-                self.pending_db_batch.copy()  # Copy so we can clear immediately
+                batch
             )
 
-            logger.debug(f"Flushed batch of {len(self.pending_db_batch)} documents to database")
-            self.pending_db_batch.clear()  # Clear for next batch
+            logger.debug("Flushed batch of {} documents to database", len(batch))
 
         except Exception as e:
             logger.error(f"Failed to flush database batch: {e}")
@@ -785,24 +829,38 @@ class AsyncBatchProcessor:
         Args:
             batch_data: List of document dictionaries to insert
 
-        Note: Currently inserts one at a time in a loop.
-        TODO: Use database's native batch insert for even better performance:
-            - PostgreSQL: INSERT ... VALUES (...), (...), ...
-            - Would be 2-3x faster than current implementation
+        How it works:
+        - Each document's row (file hash + embedding) is built once; one
+          that can't be built (e.g. its file vanished) is skipped
+        - All rows go in one transaction (multi-row INSERT, one commit)
+        - If that fails, the same rows are inserted one at a time so the
+          other documents still get saved (no embedding is generated twice)
         """
+        rows = []
         for data in batch_data:
             try:
-                self.db.add_document(
-                    file_path=data['file_path'],
-                    category=data['category'],
-                    content=data['content'],
-                    metadata=data['metadata'],
-                    confidence=data['confidence'],
+                rows.append(self.db.document_row(
+                    data,
                     model_used=self.ollama.model,
                     store_full_content=settings.store_full_content,
-                )
+                ))
             except Exception as e:
-                logger.error(f"Failed to insert document: {e}")
+                logger.error(f"Failed to prepare document {data['file_path']}: {e}")
+
+        if not rows:
+            return
+
+        try:
+            self.db.add_rows(rows)
+            return
+        except Exception as e:
+            logger.warning(f"Batch insert failed, inserting documents individually: {e}")
+
+        for row in rows:
+            try:
+                self.db.add_rows([row])
+            except Exception as e:
+                logger.error(f"Failed to insert document {row['file_name']}: {e}")
 
     # ==========================================================================
     # MAIN PROCESSING METHODS
@@ -884,13 +942,20 @@ class AsyncBatchProcessor:
         # If batch isn't full (e.g., 73 documents left), flush them now.
         await self._flush_database_batch()
 
-        # Step 4: Store results (filter out any exceptions)
-        self.results = [r for r in results if isinstance(r, AsyncBatchResult)]
-
-        # Step 5: Calculate statistics
-        successful = sum(1 for r in self.results if r.success)
-        failed = sum(1 for r in self.results if not r.success and r.error != "Duplicate document")
-        skipped = sum(1 for r in self.results if r.error == "Duplicate document")
+        # Steps 4-5: Store results (filter out any exceptions) and count
+        # outcomes in the same single pass
+        self.results = []
+        successful = failed = skipped = 0
+        for r in results:
+            if not isinstance(r, AsyncBatchResult):
+                continue
+            self.results.append(r)
+            if r.success:
+                successful += 1
+            elif r.error == "Duplicate document":
+                skipped += 1
+            else:
+                failed += 1
 
         # Step 6: Create and finalize stats
         stats = AsyncBatchStats(
@@ -947,36 +1012,28 @@ class AsyncBatchProcessor:
         """
         logger.info(f"Scanning directory: {input_dir}")
 
-        # Step 1: Default to all supported file types
-        if file_extensions is None:
-            file_extensions = [".pdf", ".docx", ".doc", ".xlsx", ".xls", ".txt", ".md"]
-
-        # Step 2: Collect matching files
-        file_paths = []
-        if recursive:
-            # Search all subdirectories
-            for ext in file_extensions:
-                file_paths.extend(input_dir.rglob(f"*{ext}"))
-        else:
-            # Search only top-level directory
-            for ext in file_extensions:
-                file_paths.extend(input_dir.glob(f"*{ext}"))
-
-        # Step 3: Filter to only files (not directories)
-        file_paths = [f for f in file_paths if f.is_file()]
+        # Steps 1-3: Collect matching files (default: all supported types)
+        # in one directory walk, skipping files over the size limit
+        file_paths = scan_documents(
+            input_dir,
+            extensions=file_extensions,
+            recursive=recursive,
+            max_size_bytes=settings.max_file_size_bytes,
+        )
 
         logger.info(f"Found {len(file_paths)} documents to process")
 
         # Step 4: Handle edge case - no files found
         if not file_paths:
             logger.warning("No documents found")
+            now = datetime.now()
             return AsyncBatchStats(
                 total_documents=0,
                 successful=0,
                 failed=0,
                 skipped_duplicates=0,
-                start_time=datetime.now(),
-                end_time=datetime.now()
+                start_time=now,
+                end_time=now
             )
 
         # Step 5: Process all found documents
@@ -1031,12 +1088,12 @@ class AsyncBatchProcessor:
                 ]
             }
         """
-        import json
-
+        total = len(self.results)
+        successful = sum(1 for r in self.results if r.success)
         export_data = {
-            "total": len(self.results),
-            "successful": sum(1 for r in self.results if r.success),
-            "failed": sum(1 for r in self.results if not r.success),
+            "total": total,
+            "successful": successful,
+            "failed": total - successful,
             "results": [
                 {
                     "file_path": str(r.file_path),
@@ -1050,8 +1107,7 @@ class AsyncBatchProcessor:
             ]
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        write_json(output_path, export_data)
 
         logger.success(f"Exported results to {output_path}")
 
@@ -1108,23 +1164,22 @@ async def async_classify_directory(
         - Quick scripts
         - Testing
     """
-    # Step 1: Create processor
-    processor = AsyncBatchProcessor(
+    # Step 1: Create processor (its thread pools are shut down on exit)
+    async with AsyncBatchProcessor(
         categories=categories,
         max_concurrent=max_concurrent,
         batch_size=batch_size,
         use_database=use_database
-    )
-
-    # Step 2: Process directory
-    stats = await processor.process_directory_async(
-        input_dir,
-        recursive=True,
-        include_reasoning=include_reasoning
-    )
-
-    # Step 3: Export results if requested
-    if export_path:
-        processor.export_results(export_path)
+    ) as processor:
+        # Step 2: Process directory
+        stats = await processor.process_directory_async(
+            input_dir,
+            recursive=True,
+            include_reasoning=include_reasoning
+        )
+
+        # Step 3: Export results if requested
+        if export_path:
+            processor.export_results(export_path)
 
     return stats
@@ -121,6 +121,8 @@ from loguru import logger
 from tqdm import tqdm
 
 from src.extractors import ExtractionService, ExtractedContent
+from src.file_scanner import scan_documents
+from src.json_utils import write_json
 from src.ollama_service import OllamaService
 from config import settings
 
@@ -329,6 +331,7 @@ class DocumentClassifier:
         # - Simple use cases don't need persistence
         # - Can process without database
         self.use_database = use_database if use_database is not None else settings.use_database
+        self.store_full_content = settings.store_full_content
         self.db = None
 
         if self.use_database:
@@ -392,7 +395,7 @@ class DocumentClassifier:
         - Classification failed (Ollama not running, AI error)
         - File doesn't exist
         """
-        logger.info(f"Classifying: {file_path.name}")
+        logger.info("Classifying: {}", file_path.name)
 
         # Step 1: Extract content from document
         #
@@ -474,7 +477,7 @@ class DocumentClassifier:
                     metadata=result.metadata,
                     confidence=result.confidence,
                     model_used=self.ollama.model,
-                    store_full_content=settings.store_full_content,
+                    store_full_content=self.store_full_content,
                 )
 
                 # Store database ID in result for reference
@@ -594,20 +597,14 @@ class DocumentClassifier:
         """
         logger.info(f"Scanning directory: {input_dir}")
 
-        # Step 1: Define supported file extensions
-        supported_extensions = {".pdf", ".docx", ".doc", ".xlsx", ".xls", ".txt", ".md"}
-
-        # Step 2: Collect all matching files
-        file_paths = []
-
-        if recursive:
-            # rglob searches recursively (all subdirectories)
-            for ext in supported_extensions:
-                file_paths.extend(input_dir.rglob(f"*{ext}"))
-        else:
-            # glob searches only specified directory
-            for ext in supported_extensions:
-                file_paths.extend(input_dir.glob(f"*{ext}"))
+        # Steps 1-2: Collect all supported files in one directory walk
+        # (recursive=True also searches all subdirectories), skipping
+        # files over the configured size limit
+        file_paths = scan_documents(
+            input_dir,
+            recursive=recursive,
+            max_size_bytes=settings.max_file_size_bytes,
+        )
 
         logger.info(f"Found {len(file_paths)} documents to classify")
 
@@ -702,8 +699,7 @@ class DocumentClassifier:
         }
 
         # Write to file with nice formatting
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        write_json(output_path, data)
 
         logger.success(f"Exported results to {output_path}")
 
@@ -860,9 +856,15 @@ class DocumentOrganizer:
         #     contracts/
         #     reports/
         #     ...
+        #
+        # One path join and one mkdir per distinct category (not per file);
+        # the joined paths are reused for every file below.
+        category_dirs = {}
         for result in results:
-            category_dir = self.output_dir / result.category
-            category_dir.mkdir(parents=True, exist_ok=True)
+            if result.category not in category_dirs:
+                category_dir = self.output_dir / result.category
+                category_dir.mkdir(parents=True, exist_ok=True)
+                category_dirs[result.category] = category_dir
 
         # Step 2: Move/copy files
         success_count = 0
@@ -873,7 +875,7 @@ class DocumentOrganizer:
             try:
                 # Determine source and destination
                 source = result.file_path
-                destination_dir = self.output_dir / result.category
+                destination_dir = category_dirs[result.category]
                 destination = destination_dir / source.name
 
                 # Step 3: Handle duplicate filenames
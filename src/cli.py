@@ -34,7 +34,11 @@ console = Console()
 
 
 def setup_logging(verbose: bool = False):
-    """Configure logging based on verbosity."""
+    """Configure logging based on verbosity.
+
+    Sinks are enqueued: records are formatted and written by a background
+    thread, so logging never blocks the document processing loop.
+    """
     logger.remove()  # Remove default handler
 
     if verbose:
@@ -42,12 +46,16 @@ def setup_logging(verbose: bool = False):
             sys.stderr,
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
             level="DEBUG",
+            enqueue=True,
         )
     else:
         logger.add(
             sys.stderr,
             format="<level>{level: <8}</level> | <level>{message}</level>",
             level="INFO",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
 
 
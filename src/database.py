@@ -2,12 +2,14 @@
 
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-import json
+import hashlib
 
 from loguru import logger
 
+from src.json_utils import write_json
+
 # Import embedding service for automatic embedding generation
 try:
     from src.embedding_service import EmbeddingService
@@ -18,7 +20,8 @@ except ImportError:
 
 try:
     import sqlalchemy as sa
-    from sqlalchemy import create_engine, Column, Integer, String, DateTime, Float, Text, Boolean, JSON
+    from sqlalchemy import create_engine, Column, Integer, String, DateTime, Float, Text, Boolean, JSON, Index, func
+    from sqlalchemy.dialects.postgresql import JSONB
     from sqlalchemy.ext.declarative import declarative_base
     from sqlalchemy.orm import sessionmaker, Session
     DATABASE_AVAILABLE = True
@@ -47,7 +50,8 @@ if DATABASE_AVAILABLE:
         # Timestamps
         created_date = Column(DateTime)
         modified_date = Column(DateTime)
-        processed_date = Column(DateTime, default=datetime.now, index=True)
+        # Filled in by the database (NOW()) rather than per row in Python
+        processed_date = Column(DateTime, server_default=func.now(), index=True)
 
         # Document metadata
         author = Column(String(255))
@@ -55,14 +59,16 @@ if DATABASE_AVAILABLE:
         page_count = Column(Integer)
 
         # Classification
-        category = Column(String(100), nullable=False, index=True)
+        category = Column(String(100), nullable=False)  # Indexed with processed_date below
         confidence = Column(Text)
         model_used = Column(String(100))
 
         # Content
         content_preview = Column(Text)  # First 1000 chars
         full_content = Column(Text)  # Optional: store full text
-        metadata_json = Column(JSON)  # Additional metadata
+        # Additional metadata. JSONB on PostgreSQL (matches the migrations):
+        # stored pre-parsed, so reads and ->> filters don't re-parse text
+        metadata_json = Column(JSON().with_variant(JSONB(), "postgresql"))
 
         # Organization
         output_path = Column(String(500))
@@ -76,6 +82,21 @@ if DATABASE_AVAILABLE:
         # The column was created by migrations, not by SQLAlchemy
         embedding = Column(Text)  # Stored as array, actual type is vector(768) in PostgreSQL
 
+        # Category listings filter by category and sort newest first; one
+        # composite index serves both (and plain category lookups)
+        __table_args__ = (
+            Index("idx_documents_category_processed_date", category, processed_date.desc()),
+            # Containment queries (metadata_json @> '{"vendor": "..."}'); the
+            # jsonb_path_ops GIN index is smaller and faster to update than
+            # the default operator class. PostgreSQL only.
+            Index(
+                "idx_documents_metadata_gin",
+                metadata_json,
+                postgresql_using="gin",
+                postgresql_ops={"metadata_json": "jsonb_path_ops"},
+            ).ddl_if(dialect="postgresql"),
+        )
+
         def __repr__(self):
             return f"<Document(id={self.id}, name='{self.file_name}', category='{self.category}')>"
 
@@ -108,7 +129,7 @@ if DATABASE_AVAILABLE:
         id = Column(Integer, primary_key=True, autoincrement=True)
         document_id = Column(Integer, index=True)
 
-        timestamp = Column(DateTime, default=datetime.now, index=True)
+        timestamp = Column(DateTime, server_default=func.now(), index=True)
 
         # Classification details
         predicted_category = Column(String(100), nullable=False)
@@ -126,6 +147,22 @@ if DATABASE_AVAILABLE:
             return f"<ClassificationHistory(id={self.id}, doc_id={self.document_id}, category='{self.predicted_category}')>"
 
 
+    def bulk_insert(session: "Session", rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert Document rows with a Core INSERT ... RETURNING id.
+
+        Skips ORM identity-map and unit-of-work bookkeeping; SQLAlchemy
+        batches the rows into multi-row VALUES statements. The caller
+        commits.
+
+        Returns:
+            Document IDs, in the order of ``rows``
+        """
+        if not rows:
+            return []
+        stmt = sa.insert(Document).returning(Document.id, sort_by_parameter_order=True)
+        return list(session.execute(stmt, rows).scalars())
+
+
 class DatabaseService:
     """Service for interacting with the document database."""
 
@@ -210,49 +247,23 @@ class DatabaseService:
         session = self.get_session()
 
         try:
-            # Calculate file hash for deduplication
-            import hashlib
-            file_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
-
-            # Generate embedding if enabled and service is available
-            embedding = None
-            if self.auto_generate_embeddings and self.embedding_service and content:
-                try:
-                    # Truncate content to avoid Ollama errors (max 2000 chars)
-                    content_for_embedding = content[:2000] if len(content) > 2000 else content
-                    embedding = self.embedding_service.embed_text(content_for_embedding)
-                    logger.info(f"✓ Generated embedding for {file_path.name} ({len(embedding)} dimensions)")
-                except Exception as e:
-                    logger.warning(f"Failed to generate embedding for {file_path.name}: {e}")
-                    logger.warning("Document will be added without embedding")
-
-            doc = Document(
-                file_path=str(file_path),
-                file_name=file_path.name,
-                file_type=metadata.get("file_type"),
-                file_size=metadata.get("file_size"),
-                file_hash=file_hash,
-                created_date=metadata.get("created_date"),
-                modified_date=metadata.get("modified_date"),
-                author=metadata.get("author"),
-                title=metadata.get("title"),
-                page_count=metadata.get("page_count"),
+            doc = Document(**self._document_row(
+                file_path=file_path,
                 category=category,
+                content=content,
+                metadata=metadata,
                 confidence=confidence,
                 model_used=model_used,
-                content_preview=content[:1000] if content else None,
-                full_content=content if store_full_content else None,
-                metadata_json=metadata,
                 classification_time=classification_time,
-                embedding=embedding,  # Add the generated embedding
-            )
+                store_full_content=store_full_content,
+            ))
 
             session.add(doc)
             session.commit()
 
             doc_id = doc.id
-            embedding_status = "with embedding" if embedding else "without embedding"
-            logger.debug(f"Added document to database: {file_path.name} (ID: {doc_id}) {embedding_status}")
+            embedding_status = "with embedding" if doc.embedding else "without embedding"
+            logger.debug("Added document to database: {} (ID: {}) {}", file_path.name, doc_id, embedding_status)
 
             return doc_id
 
@@ -263,6 +274,145 @@ class DatabaseService:
         finally:
             session.close()
 
+    def add_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        model_used: Optional[str] = None,
+        store_full_content: bool = False,
+    ) -> List[int]:
+        """Add several classified documents in one transaction.
+
+        The rows go through bulk_insert (a Core multi-row INSERT ...
+        RETURNING, no ORM objects), so a batch costs one round-trip and one
+        commit instead of one per document. If any row fails, none are
+        added.
+
+        Args:
+            documents: Dicts with the add_document arguments: file_path,
+                category, content, metadata and optionally confidence and
+                classification_time
+            model_used: Name of model used
+            store_full_content: Store full content (can be large)
+
+        Returns:
+            Document IDs, in input order
+        """
+        rows = [
+            self.document_row(data, model_used=model_used, store_full_content=store_full_content)
+            for data in documents
+        ]
+        return self.add_rows(rows)
+
+    def document_row(
+        self,
+        data: Dict[str, Any],
+        model_used: Optional[str] = None,
+        store_full_content: bool = False,
+    ) -> Dict[str, Any]:
+        """Build the column values for one add_documents() dict.
+
+        Hashes the file and generates the embedding, so a caller that may
+        have to retry the insert can build rows once and pass them to
+        add_rows() again.
+
+        Args:
+            data: Dict with the add_document arguments (see add_documents)
+            model_used: Name of model used
+            store_full_content: Store full content (can be large)
+
+        Returns:
+            Row dict for add_rows()
+        """
+        return self._document_row(
+            file_path=Path(data["file_path"]),
+            category=data["category"],
+            content=data["content"],
+            metadata=data["metadata"],
+            confidence=data.get("confidence"),
+            model_used=model_used,
+            classification_time=data.get("classification_time"),
+            store_full_content=store_full_content,
+        )
+
+    def add_rows(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert rows built by document_row() in one transaction.
+
+        Args:
+            rows: Row dicts from document_row()
+
+        Returns:
+            Document IDs, in input order
+        """
+        session = self.get_session()
+
+        try:
+            doc_ids = bulk_insert(session, rows)
+            session.commit()
+
+            logger.debug("Added {} documents to database", len(doc_ids))
+
+            return doc_ids
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to add documents to database: {e}")
+            raise
+        finally:
+            session.close()
+
+    def _document_row(
+        self,
+        file_path: Path,
+        category: str,
+        content: str,
+        metadata: Dict[str, Any],
+        confidence: Optional[str],
+        model_used: Optional[str],
+        classification_time: Optional[float],
+        store_full_content: bool,
+    ) -> Dict[str, Any]:
+        """Build the Document column values for a classified file."""
+        # Calculate file hash for deduplication (streamed, so large
+        # files are never loaded into memory whole)
+        with open(file_path, "rb") as f:
+            file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+
+        # Generate embedding if enabled and service is available
+        embedding = None
+        if self.auto_generate_embeddings and self.embedding_service and content:
+            try:
+                # Truncate content to avoid Ollama errors (max 2000 chars)
+                content_for_embedding = content[:2000] if len(content) > 2000 else content
+                embedding = self.embedding_service.embed_text(content_for_embedding) or None
+                if embedding:
+                    logger.debug("✓ Generated embedding for {} ({} dimensions)", file_path.name, len(embedding))
+                else:
+                    logger.warning(f"Embedding generation failed for {file_path.name}, adding without embedding")
+            except Exception as e:
+                logger.warning(f"Failed to generate embedding for {file_path.name}: {e}")
+                logger.warning("Document will be added without embedding")
+
+        return {
+            "file_path": str(file_path),
+            "file_name": file_path.name,
+            "file_type": metadata.get("file_type"),
+            "file_size": metadata.get("file_size"),
+            "file_hash": file_hash,
+            "created_date": metadata.get("created_date"),
+            "modified_date": metadata.get("modified_date"),
+            "author": metadata.get("author"),
+            "title": metadata.get("title"),
+            "page_count": metadata.get("page_count"),
+            "category": category,
+            "confidence": confidence,
+            "model_used": model_used,
+            "content_preview": content[:1000] if content else None,
+            "full_content": content if store_full_content else None,
+            "metadata_json": metadata,
+            "classification_time": classification_time,
+            "embedding": embedding,  # Add the generated embedding
+        }
+
     def update_document_path(self, doc_id: int, output_path: Path):
         """Update document output path after organization.
 
@@ -278,7 +428,7 @@ class DatabaseService:
                 doc.output_path = str(output_path)
                 doc.is_organized = True
                 session.commit()
-                logger.debug(f"Updated document path: {doc_id} -> {output_path}")
+                logger.debug("Updated document path: {} -> {}", doc_id, output_path)
         finally:
             session.close()
 
@@ -450,7 +600,6 @@ class DatabaseService:
         session = self.get_session()
 
         try:
-            from datetime import timedelta
             start_date = datetime.now() - timedelta(days=days)
 
             history = (
@@ -506,8 +655,7 @@ class DatabaseService:
             docs = q.all()
             data = [doc.to_dict() for doc in docs]
 
-            with open(output_file, "w") as f:
-                json.dump(data, f, indent=2)
+            write_json(output_file, data)
 
             logger.success(f"Exported {len(data)} documents to {output_file}")
         finally:
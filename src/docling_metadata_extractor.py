@@ -12,6 +12,7 @@ Improvements over basic text extraction:
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
@@ -26,7 +27,7 @@ except ImportError:
     DOCLING_AVAILABLE = False
     logger.warning("Docling not available - install with: pip install docling")
 
-from llm_metadata_extractor import ConfigurableMetadataExtractor
+from src.llm_metadata_extractor import ConfigurableMetadataExtractor
 
 
 class DoclingMetadataExtractor(ConfigurableMetadataExtractor):
@@ -157,6 +158,12 @@ class DoclingMetadataExtractor(ConfigurableMetadataExtractor):
         return self.extract(text, category, file_metadata)
 
 
+@lru_cache(maxsize=8)
+def _get_extractor(model: str, use_ocr: bool) -> DoclingMetadataExtractor:
+    """Build one extractor per (model, use_ocr); Docling pipeline setup is slow."""
+    return DoclingMetadataExtractor(model=model, use_ocr=use_ocr)
+
+
 # Convenience function
 def extract_metadata_from_file(
     file_path: str,
@@ -176,5 +183,4 @@ def extract_metadata_from_file(
     Returns:
         Extracted metadata
     """
-    extractor = DoclingMetadataExtractor(model=model, use_ocr=use_ocr)
-    return extractor.extract_from_file(file_path, category)
+    return _get_extractor(model, use_ocr).extract_from_file(file_path, category)
@@ -16,8 +16,58 @@ from typing import List, Optional, Any
 from enum import Enum
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from loguru import logger
 
+from src.json_utils import loads
+
+# Keep-alive connections held per host. Batch processors call these services
+# from many threads at once; requests' default of 10 makes every extra
+# thread open (and then discard) a new connection.
+HTTP_POOL_SIZE = 64
+
+
+def create_http_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Create a pooled HTTP session for calls to model servers.
+
+    Connection failures and 502/503/504 responses are retried with
+    exponential backoff, so a briefly overloaded Ollama does not fail the
+    document outright.
+
+    Args:
+        pool_size: Maximum keep-alive connections per host
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def parse_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body.
+
+    The raw bytes are parsed directly (with orjson when installed),
+    skipping requests' charset detection and bytes-to-str decode;
+    embedding responses are ~768 floats, so this is most of the
+    client-side cost.
+    """
+    return loads(response.content)
+
 
 class EmbeddingProvider(str, Enum):
     """Supported embedding providers."""
@@ -30,7 +80,11 @@ class BaseEmbeddingService(ABC):
 
     @abstractmethod
     def embed_text(self, text: str) -> List[float]:
-        """Generate embedding for a single text."""
+        """Generate embedding for a single text.
+
+        Returns an empty list on failure. A zero-vector placeholder would be
+        indexed as a real point and tie with every query under cosine kNN.
+        """
         pass
 
     @abstractmethod
@@ -67,12 +121,14 @@ class OllamaEmbeddingService(BaseEmbeddingService):
         self.host = host.rstrip("/")
         self.model = model
         self.dimension = dimension
+        # One keep-alive connection pool for every embedding request
+        self.session = create_http_session()
         self._check_model_available()
 
     def _check_model_available(self):
         """Check if embedding model is available."""
         try:
-            response = requests.get(f"{self.host}/api/tags")
+            response = self.session.get(f"{self.host}/api/tags")
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 model_names = [m.get("name", "").split(":")[0] for m in models]
@@ -97,7 +153,7 @@ class OllamaEmbeddingService(BaseEmbeddingService):
             List of floats representing the embedding
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.host}/api/embeddings",
                 json={
                     "model": self.model,
@@ -107,7 +163,7 @@ class OllamaEmbeddingService(BaseEmbeddingService):
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json_response(response)
                 embedding = data.get("embedding", [])
 
                 if len(embedding) != self.dimension:
@@ -118,11 +174,11 @@ class OllamaEmbeddingService(BaseEmbeddingService):
                 return embedding
             else:
                 logger.error(f"Ollama embedding failed: {response.status_code}")
-                return [0.0] * self.dimension
+                return []
 
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
-            return [0.0] * self.dimension
+            return []
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple texts.
@@ -136,7 +192,7 @@ class OllamaEmbeddingService(BaseEmbeddingService):
         embeddings = []
         for i, text in enumerate(texts):
             if i > 0 and i % 10 == 0:
-                logger.debug(f"Generated {i}/{len(texts)} embeddings")
+                logger.debug("Generated {}/{} embeddings", i, len(texts))
 
             embedding = self.embed_text(text)
             embeddings.append(embedding)
@@ -193,7 +249,7 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
             text: Text to embed
 
         Returns:
-            List of floats representing the embedding
+            List of floats representing the embedding (empty on failure)
         """
         try:
             response = self.client.embeddings.create(
@@ -211,7 +267,7 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
 
         except Exception as e:
             logger.error(f"OpenAI embedding error: {e}")
-            return [0.0] * self.dimension
+            return []
 
     def embed_batch(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
         """Generate embeddings for multiple texts using batch API.
@@ -244,12 +300,12 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
 
                 all_embeddings.extend(batch_embeddings)
 
-                logger.debug(f"Generated {len(all_embeddings)}/{len(texts)} embeddings")
+                logger.debug("Generated {}/{} embeddings", len(all_embeddings), len(texts))
 
             except Exception as e:
                 logger.error(f"Batch embedding error: {e}")
-                # Return zero vectors for failed batch
-                all_embeddings.extend([[0.0] * self.dimension] * len(batch))
+                # Return empty embeddings for failed batch
+                all_embeddings.extend([] for _ in batch)
 
         return all_embeddings
 
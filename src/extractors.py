@@ -147,7 +147,7 @@ class PDFExtractor(BaseExtractor):
             total_confidence = 0
             
             for page_num, image in enumerate(images, 1):
-                logger.debug(f"Processing page {page_num} with OCR")
+                logger.debug("Processing page {} with OCR", page_num)
                 
                 # Extract text from the page image
                 ocr_result = self.ocr_processor.extract_text_from_pdf_image(image)
@@ -281,9 +281,11 @@ class ImageExtractor(BaseExtractor):
 class DOCXExtractor(BaseExtractor):
     """Extractor for Word documents."""
 
+    SUPPORTED_FORMATS = frozenset({".docx", ".doc"})
+
     def can_extract(self, file_path: Path) -> bool:
         """Check if file is a DOCX."""
-        return file_path.suffix.lower() in [".docx", ".doc"]
+        return file_path.suffix.lower() in self.SUPPORTED_FORMATS
 
     def extract(self, file_path: Path) -> ExtractedContent:
         """Extract text and metadata from DOCX."""
@@ -326,9 +328,11 @@ class DOCXExtractor(BaseExtractor):
 class ExcelExtractor(BaseExtractor):
     """Extractor for Excel spreadsheets."""
 
+    SUPPORTED_FORMATS = frozenset({".xlsx", ".xls", ".xlsm"})
+
     def can_extract(self, file_path: Path) -> bool:
         """Check if file is an Excel file."""
-        return file_path.suffix.lower() in [".xlsx", ".xls", ".xlsm"]
+        return file_path.suffix.lower() in self.SUPPORTED_FORMATS
 
     def extract(self, file_path: Path) -> ExtractedContent:
         """Extract text and metadata from Excel."""
@@ -375,9 +379,11 @@ class ExcelExtractor(BaseExtractor):
 class TextExtractor(BaseExtractor):
     """Extractor for plain text files."""
 
+    SUPPORTED_FORMATS = frozenset({".txt", ".md", ".csv", ".json", ".xml"})
+
     def can_extract(self, file_path: Path) -> bool:
         """Check if file is a text file."""
-        return file_path.suffix.lower() in [".txt", ".md", ".csv", ".json", ".xml"]
+        return file_path.suffix.lower() in self.SUPPORTED_FORMATS
 
     def extract(self, file_path: Path) -> ExtractedContent:
         """Extract text from plain text file."""
@@ -426,6 +432,10 @@ class ExtractionService:
             TextExtractor(),
         ])
 
+        # Lowercased suffix -> first extractor that accepts it (None if
+        # none does); every can_extract() decides on the suffix alone
+        self._extractor_by_suffix: Dict[str, Optional[BaseExtractor]] = {}
+
     def _create_basic_pdf_extractor(self):
         """Create a basic PDF extractor without OCR capabilities."""
         class BasicPDFExtractor(BaseExtractor):
@@ -464,16 +474,28 @@ class ExtractionService:
             logger.error(f"File not found: {file_path}")
             return None
 
-        for extractor in self.extractors:
-            if extractor.can_extract(file_path):
-                try:
-                    return extractor.extract(file_path)
-                except Exception as e:
-                    logger.error(f"Failed to extract {file_path.name}: {e}")
-                    return None
+        extractor = self._extractor_for(file_path)
+        if extractor is None:
+            logger.warning(f"No extractor found for {file_path.name}")
+            return None
+
+        try:
+            return extractor.extract(file_path)
+        except Exception as e:
+            logger.error(f"Failed to extract {file_path.name}: {e}")
+            return None
 
-        logger.warning(f"No extractor found for {file_path.name}")
-        return None
+    def _extractor_for(self, file_path: Path) -> Optional[BaseExtractor]:
+        """Pick the extractor for a file, probing each suffix only once."""
+        suffix = file_path.suffix.lower()
+        try:
+            return self._extractor_by_suffix[suffix]
+        except KeyError:
+            extractor = next(
+                (e for e in self.extractors if e.can_extract(file_path)), None
+            )
+            self._extractor_by_suffix[suffix] = extractor
+            return extractor
 
     def extract_batch(self, file_paths: List[Path]) -> List[ExtractedContent]:
         """Extract content from multiple documents."""
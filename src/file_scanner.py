@@ -0,0 +1,65 @@
+"""Directory scanning for documents to process."""
+
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from loguru import logger
+
+
+# Extensions picked up when the caller doesn't pass its own list
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".doc", ".xlsx", ".xls", ".txt", ".md")
+
+
+def scan_documents(
+    input_dir: Path,
+    extensions: Optional[Iterable[str]] = None,
+    recursive: bool = True,
+    max_size_bytes: Optional[int] = None,
+) -> List[Path]:
+    """Collect document files under a directory in a single walk.
+
+    One os.scandir() pass replaces a separate glob/rglob walk per
+    extension. Extension matching is case-insensitive (report.PDF is
+    found), and the size limit is checked against the DirEntry's stat.
+    Symlinked directories are not descended into.
+
+    Args:
+        input_dir: Directory to scan
+        extensions: File extensions to include (default: SUPPORTED_EXTENSIONS)
+        recursive: Also scan subdirectories
+        max_size_bytes: Skip files larger than this (None = no limit)
+
+    Returns:
+        Sorted list of matching file paths
+    """
+    wanted = frozenset(ext.lower() for ext in (extensions or SUPPORTED_EXTENSIONS))
+    found: List[Path] = []
+    too_large = 0
+
+    pending = [os.fspath(input_dir)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() not in wanted:
+                        continue
+                    if not entry.is_file():
+                        continue
+                    if max_size_bytes is not None and entry.stat().st_size > max_size_bytes:
+                        too_large += 1
+                        continue
+                    found.append(Path(entry.path))
+        except OSError as e:
+            logger.warning(f"Cannot scan {directory}: {e}")
+
+    if too_large:
+        logger.warning(f"Skipped {too_large} files larger than {max_size_bytes} bytes")
+
+    found.sort()
+    return found
@@ -10,10 +10,12 @@ Flexible metadata extraction using:
 """
 
 import json
+import time
+from functools import lru_cache
 import yaml
 import re
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from loguru import logger
 
@@ -24,6 +26,25 @@ except ImportError:
     OLLAMA_AVAILABLE = False
     logger.warning("Ollama not available, LLM extraction will be disabled")
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Raises json.JSONDecodeError (or a subclass) with or without orjson
+from src.json_utils import loads as _json_loads
+
+
+@lru_cache(maxsize=64)
+def _normalize_category(category: str) -> str:
+    """Schema lookup key for a category name (cached; categories repeat)."""
+    return category.strip().lower()
+
+
+# Rough characters-per-token ratio used when no tokenizer is installed
+CHARS_PER_TOKEN = 4
+
 
 class ConfigurableMetadataExtractor:
     """
@@ -37,7 +58,10 @@ class ConfigurableMetadataExtractor:
         self,
         schema_path: str = None,
         model: str = "llama3.2:3b",
-        max_text_length: int = 4000
+        max_text_length: int = 4000,
+        context_window: int = 8192,
+        max_output_tokens: int = 1024,
+        generation_timeout: float = 120.0
     ):
         """
         Initialize the extractor.
@@ -45,12 +69,28 @@ class ConfigurableMetadataExtractor:
         Args:
             schema_path: Path to YAML schema configuration file
             model: Ollama model to use for extraction
-            max_text_length: Maximum text length to send to LLM
+            max_text_length: Maximum text length (characters) to send to LLM
+                when no tokenizer is available
+            context_window: Model context size in tokens (Ollama num_ctx)
+            max_output_tokens: Maximum tokens the LLM may generate (num_predict)
+            generation_timeout: Seconds before a streaming generation is abandoned
         """
         self.model = model
         self.max_text_length = max_text_length
+        self.context_window = context_window
+        self.max_output_tokens = max_output_tokens
+        self.generation_timeout = generation_timeout
         self.available = OLLAMA_AVAILABLE
 
+        # Tokenizer for prompt budgeting (cl100k_base is close enough to
+        # llama tokenization for sizing purposes)
+        self.encoding = None
+        if TIKTOKEN_AVAILABLE:
+            try:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                logger.warning(f"Failed to load tokenizer, using character budget: {e}")
+
         # Load schema configuration
         if schema_path is None:
             # Default to config/metadata_schemas.yaml
@@ -60,6 +100,30 @@ class ConfigurableMetadataExtractor:
         self.schema_path = Path(schema_path)
         self.schemas = self._load_schemas()
 
+        # Prompt text around the document, compiled once per category as
+        # (prefix, suffix, token count of prefix + suffix)
+        self._prompts: Dict[str, Tuple[str, str, int]] = {
+            category: self._compile_prompt(*self._extraction_prompt_parts(schema))
+            for category, schema in self.schemas.items()
+            if isinstance(schema, dict) and schema
+        }
+        self._generic_prompt = self._compile_prompt(*self._generic_prompt_parts())
+
+        # Per-category field lookups used when validating and scoring results:
+        # (field name -> type, required field names, all field names)
+        self._field_specs: Dict[str, Tuple[Dict[str, str], Tuple[str, ...], Tuple[str, ...]]] = {
+            category: (
+                {
+                    name: (config or {}).get('type', 'string')
+                    for name, config in (schema.get('fields') or {}).items()
+                },
+                tuple(schema.get('required_fields') or ()),
+                tuple(schema.get('fields') or ()),
+            )
+            for category, schema in self.schemas.items()
+            if isinstance(schema, dict) and schema
+        }
+
         logger.info(f"Loaded {len(self.schemas)} metadata schemas from {self.schema_path}")
         logger.info(f"Available categories: {list(self.schemas.keys())}")
 
@@ -79,7 +143,7 @@ class ConfigurableMetadataExtractor:
 
     def get_schema(self, category: str) -> Optional[Dict[str, Any]]:
         """Get schema for a specific document category."""
-        return self.schemas.get(category.lower())
+        return self.schemas.get(_normalize_category(category))
 
     def _build_extraction_prompt(self, text: str, category: str) -> str:
         """
@@ -92,26 +156,33 @@ class ConfigurableMetadataExtractor:
         Returns:
             Formatted prompt for the LLM
         """
-        schema = self.get_schema(category)
+        prompt = self._prompts.get(_normalize_category(category))
 
-        if not schema:
+        if not prompt:
             logger.warning(f"No schema found for category: {category}")
             return self._build_generic_prompt(text)
 
-        # Truncate text if needed
-        text_sample = text[:self.max_text_length]
-        if len(text) > self.max_text_length:
-            logger.debug(f"Text truncated from {len(text)} to {self.max_text_length} characters")
+        prefix, suffix, static_tokens = prompt
 
+        # Truncate text to what fits beside the fixed part of the prompt
+        return f"{prefix}{self._truncate_to_budget(text, static_tokens)}{suffix}"
+
+    def _compile_prompt(self, prefix: str, suffix: str) -> Tuple[str, str, int]:
+        """Pair prompt prefix/suffix with their combined token count."""
+        return prefix, suffix, self._count_tokens(prefix + suffix)
+
+    def _extraction_prompt_parts(self, schema: Dict[str, Any]) -> Tuple[str, str]:
+        """Split the schema extraction prompt into text before/after the document."""
         # Build JSON schema description for the LLM
         fields_description = self._format_fields_for_prompt(schema.get('fields', {}))
 
         # Simpler, more direct prompt that works better with smaller models
-        prompt = f"""Extract metadata from this invoice/receipt and return as JSON.
+        prefix = """Extract metadata from this invoice/receipt and return as JSON.
 
 Document text:
 ---
-{text_sample}
+"""
+        suffix = f"""
 ---
 
 Extract ALL these fields (use null if not found):
@@ -120,8 +191,45 @@ Extract ALL these fields (use null if not found):
 Return ONLY the JSON object with NO other text. Use YYYY-MM-DD for dates, numbers (not strings) for amounts.
 
 JSON:"""
+        return prefix, suffix
 
-        return prompt
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in text (estimated from length without a tokenizer)."""
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return len(text) // CHARS_PER_TOKEN + 1
+
+    def _truncate_to_budget(self, text: str, static_tokens: int) -> str:
+        """
+        Truncate document text to the token budget left in the context window.
+
+        Args:
+            text: Document text
+            static_tokens: Tokens used by the prompt template itself
+
+        Returns:
+            Text that fits in context_window - max_output_tokens - static_tokens
+        """
+        budget = max(self.context_window - self.max_output_tokens - static_tokens, 0)
+
+        if self.encoding is None:
+            limit = min(budget * CHARS_PER_TOKEN, self.max_text_length)
+            if len(text) > limit:
+                logger.debug(f"Text truncated from {len(text)} to {limit} characters")
+            return text[:limit]
+
+        # Only encode a prefix: budget tokens never need more than about
+        # budget * CHARS_PER_TOKEN characters, so 2x that is a safe cut and
+        # a large PDF isn't tokenized in full just to keep its start
+        prefix = text[:budget * CHARS_PER_TOKEN * 2]
+        tokens = self.encoding.encode(prefix, disallowed_special=())
+        if len(tokens) <= budget:
+            if len(prefix) < len(text):
+                logger.debug(f"Text truncated from {len(text)} to {len(prefix)} characters")
+            return prefix
+
+        logger.debug(f"Text truncated from {len(text)} characters to {budget} tokens")
+        return self.encoding.decode(tokens[:budget])
 
     def _format_fields_for_prompt(self, fields: Dict[str, Any]) -> str:
         """Format field definitions for the prompt."""
@@ -144,12 +252,16 @@ JSON:"""
 
     def _build_generic_prompt(self, text: str) -> str:
         """Build a generic extraction prompt when no schema is available."""
-        text_sample = text[:self.max_text_length]
+        prefix, suffix, static_tokens = self._generic_prompt
+        return f"{prefix}{self._truncate_to_budget(text, static_tokens)}{suffix}"
 
-        return f"""Extract key metadata from this document as JSON.
+    def _generic_prompt_parts(self) -> Tuple[str, str]:
+        """Split the generic extraction prompt into text before/after the document."""
+        prefix = """Extract key metadata from this document as JSON.
 
 Document text:
-{text_sample}
+"""
+        suffix = """
 
 Extract relevant information such as:
 - Dates (in YYYY-MM-DD format)
@@ -159,6 +271,7 @@ Extract relevant information such as:
 - Any other important structured information
 
 Return ONLY valid JSON (no other text):"""
+        return prefix, suffix
 
     def extract(
         self,
@@ -185,28 +298,18 @@ Return ONLY valid JSON (no other text):"""
             logger.warning("Empty text provided for extraction")
             return file_metadata or {}
 
-        logger.info(f"Extracting metadata for category: {category}")
+        logger.debug("Extracting metadata for category: {}", category)
 
         # Build prompt
         prompt = self._build_extraction_prompt(text, category)
 
         # Call LLM
         try:
-            logger.debug(f"Calling Ollama model: {self.model}")
-
-            response = ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                options={
-                    "temperature": 0.1,  # Low temperature for factual extraction
-                    "top_p": 0.9,
-                    "num_predict": 2000,  # Allow longer responses
-                }
-            )
+            logger.debug("Calling Ollama model: {}", self.model)
 
-            response_text = response.get('response', '{}').strip()
-            logger.debug(f"LLM response length: {len(response_text)} characters")
-            logger.debug(f"LLM response (first 500 chars): {response_text[:500]}")
+            response_text = self._generate_json(prompt).strip()
+            logger.debug("LLM response length: {} characters", len(response_text))
+            logger.opt(lazy=True).debug("LLM response (first 500 chars): {}", lambda: response_text[:500])
 
             # Extract JSON from response
             metadata = self._extract_json_from_response(response_text)
@@ -224,7 +327,7 @@ Return ONLY valid JSON (no other text):"""
             if file_metadata:
                 metadata = {**file_metadata, **metadata}
 
-            logger.info(f"✓ Extraction complete (confidence: {metadata['extraction_confidence']:.2f})")
+            logger.debug("✓ Extraction complete (confidence: {:.2f})", metadata['extraction_confidence'])
 
             return metadata
 
@@ -233,6 +336,73 @@ Return ONLY valid JSON (no other text):"""
             logger.exception(e)
             return file_metadata or {}
 
+    def _generate_json(self, prompt: str) -> str:
+        """
+        Stream a generation from Ollama until the JSON object is complete.
+
+        Tokens are consumed as they arrive and brace depth is tracked (outside
+        of string literals); the stream is closed as soon as the top-level
+        object closes, so trailing chatter is never generated. Generation is
+        also abandoned once generation_timeout elapses.
+
+        Returns:
+            Raw response text received so far
+        """
+        deadline = time.monotonic() + self.generation_timeout
+        parts = []
+        depth = 0
+        in_string = False
+        escaped = False
+        complete = False
+
+        stream = ollama.generate(
+            model=self.model,
+            prompt=prompt,
+            stream=True,
+            options={
+                "temperature": 0.1,  # Low temperature for factual extraction
+                "top_p": 0.9,
+                "num_ctx": self.context_window,
+                "num_predict": self.max_output_tokens,  # Bound decode length
+            }
+        )
+
+        try:
+            for chunk in stream:
+                piece = chunk['response']
+                parts.append(piece)
+
+                for char in piece:
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == '\\':
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"':
+                        in_string = depth > 0
+                    elif char == '{':
+                        depth += 1
+                    elif char == '}' and depth > 0:
+                        depth -= 1
+                        complete = depth == 0
+                        if complete:
+                            break
+
+                if complete or chunk.get('done'):
+                    break
+
+                if time.monotonic() > deadline:
+                    logger.warning(f"LLM generation exceeded {self.generation_timeout}s, using partial response")
+                    break
+        finally:
+            # Closing the stream drops the connection, which stops generation
+            if hasattr(stream, 'close'):
+                stream.close()
+
+        return ''.join(parts)
+
     def _extract_json_from_response(self, response_text: str) -> Dict[str, Any]:
         """
         Extract JSON object from LLM response.
@@ -245,14 +415,14 @@ Return ONLY valid JSON (no other text):"""
 
         if json_match:
             try:
-                return json.loads(json_match.group())
+                return _json_loads(json_match.group())
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse JSON: {e}")
                 logger.debug(f"Problematic JSON: {json_match.group()[:200]}")
 
         # Try parsing the entire response as JSON
         try:
-            return json.loads(response_text)
+            return _json_loads(response_text)
         except json.JSONDecodeError:
             logger.error("Could not find valid JSON in response")
             logger.debug(f"Response text: {response_text[:500]}")
@@ -269,11 +439,11 @@ Return ONLY valid JSON (no other text):"""
         Returns:
             Cleaned and validated metadata
         """
-        schema = self.get_schema(category)
-        if not schema:
+        spec = self._field_specs.get(_normalize_category(category))
+        if not spec:
             return self._clean_null_values(metadata)
 
-        fields_config = schema.get('fields', {})
+        field_types = spec[0]
         cleaned = {}
 
         for field_name, value in metadata.items():
@@ -281,8 +451,7 @@ Return ONLY valid JSON (no other text):"""
             if value is None or value == "" or value == "null":
                 continue
 
-            field_config = fields_config.get(field_name, {})
-            field_type = field_config.get('type', 'string')
+            field_type = field_types.get(field_name, 'string')
 
             # Type validation and conversion
             try:
@@ -335,14 +504,13 @@ Return ONLY valid JSON (no other text):"""
         - Number of fields extracted
         - Schema completeness
         """
-        schema = self.get_schema(category)
+        spec = self._field_specs.get(_normalize_category(category))
 
-        if not schema:
+        if not spec:
             # No schema - base confidence on number of fields
             return min(len(metadata) / 5, 1.0) * 0.5  # Max 0.5 without schema
 
-        required_fields = schema.get('required_fields', [])
-        all_fields = list(schema.get('fields', {}).keys())
+        _, required_fields, all_fields = spec
 
         if not required_fields and not all_fields:
             return 0.5
@@ -358,10 +526,10 @@ Return ONLY valid JSON (no other text):"""
 
         # Calculate optional field score
         if all_fields:
-            optional_score = len([
-                f for f in all_fields
+            optional_score = sum(
+                1 for f in all_fields
                 if f in metadata and metadata[f]
-            ]) / len(all_fields)
+            ) / len(all_fields)
         else:
             optional_score = 0.5
 
@@ -390,7 +558,9 @@ Return ONLY valid JSON (no other text):"""
         results = []
 
         for i, doc in enumerate(documents):
-            logger.info(f"Processing document {i+1}/{len(documents)}")
+            logger.debug("Processing document {}/{}", i + 1, len(documents))
+            if i and i % 100 == 0:
+                logger.info(f"Extracted metadata for {i}/{len(documents)} documents")
 
             text = doc.get(text_field, '')
             category = doc.get(category_field, 'unknown')
@@ -31,6 +31,16 @@ from metadata_schema import (
     get_metadata_class
 )
 
+# Per category: (required fields, important fields) used to score extractions
+CONFIDENCE_FIELDS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    'invoices': (('invoice_number', 'total_amount'), ('invoice_date', 'vendor_name', 'subtotal')),
+    'contracts': (('contract_number',), ('party_a', 'party_b', 'start_date')),
+    'reports': (('report_type',), ('fiscal_year', 'department')),
+}
+
+# Placeholder values the LLM uses for "not found"
+_EMPTY_VALUES = frozenset({"", "null"})
+
 
 class RuleBasedExtractor:
     """Rule-based extraction using regex patterns."""
@@ -348,7 +358,10 @@ Return ONLY the JSON object, no explanations."""
             if json_match:
                 metadata = json.loads(json_match.group())
                 # Clean up null/None values
-                return {k: v for k, v in metadata.items() if v is not None and v != "" and v != "null"}
+                return {
+                    k: v for k, v in metadata.items()
+                    if v is not None and not (isinstance(v, str) and v in _EMPTY_VALUES)
+                }
             return {}
 
         except Exception as e:
@@ -402,7 +415,9 @@ class HybridMetadataExtractor:
             llm_metadata = self.llm_extractor.extract_metadata(text, category)
 
             # Merge: prefer LLM results for missing fields, keep rule-based for existing
-            merged_metadata = {**llm_metadata, **rule_metadata}
+            # (llm_metadata is a fresh dict, so merge into it instead of copying)
+            merged_metadata = llm_metadata
+            merged_metadata.update(rule_metadata)
             extraction_method = "hybrid"
             confidence = self._calculate_confidence(merged_metadata, category)
         else:
@@ -425,17 +440,10 @@ class HybridMetadataExtractor:
 
     def _calculate_confidence(self, metadata: Dict[str, Any], category: str) -> float:
         """Calculate confidence score based on extracted fields."""
-        if category == 'invoices':
-            required_fields = ['invoice_number', 'total_amount']
-            important_fields = ['invoice_date', 'vendor_name', 'subtotal']
-        elif category == 'contracts':
-            required_fields = ['contract_number']
-            important_fields = ['party_a', 'party_b', 'start_date']
-        elif category == 'reports':
-            required_fields = ['report_type']
-            important_fields = ['fiscal_year', 'department']
-        else:
+        fields = CONFIDENCE_FIELDS.get(category)
+        if fields is None:
             return 0.5
+        required_fields, important_fields = fields
 
         required_score = sum(1 for f in required_fields if metadata.get(f)) / len(required_fields)
         important_score = sum(1 for f in important_fields if metadata.get(f)) / len(important_fields)
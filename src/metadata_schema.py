@@ -7,7 +7,7 @@ Defines the schema for extracted business metadata from different document categ
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from decimal import Decimal
 
 
@@ -30,12 +30,16 @@ class BaseDocumentMetadata(BaseModel):
     extraction_confidence: Optional[float] = None  # 0.0 - 1.0
     extracted_at: Optional[datetime] = None
 
-    class Config:
-        json_encoders = {
+    # Validators are built on first use instead of at import, so importing
+    # the extractors doesn't pay for six schemas that a run may never touch
+    model_config = ConfigDict(
+        defer_build=True,
+        json_encoders={
             datetime: lambda v: v.isoformat() if v else None,
             date: lambda v: v.isoformat() if v else None,
             Decimal: lambda v: float(v) if v else None,
         }
+    )
 
 
 class InvoiceMetadata(BaseDocumentMetadata):
@@ -1,32 +1,119 @@
 """Ollama integration service for AI-powered document classification."""
 
+import itertools
 import json
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import requests
 from loguru import logger
 
 from config import settings
+from src.embedding_service import create_http_session, parse_json_response
+
+# Exponentially weighted error rate above which a host is quarantined
+ERROR_RATE_ALPHA = 0.3
+ERROR_RATE_THRESHOLD = 0.5
+QUARANTINE_SECONDS = 30.0
+
+CLASSIFY_SYSTEM_PROMPT = """You are an expert document classifier. Your task is to analyze documents and classify them into the most appropriate category based on their content, structure, and metadata.
+
+Be precise and consistent. Only respond with the category name, nothing else."""
+
+CLASSIFY_WITH_REASONING_SYSTEM_PROMPT = """You are an expert document classifier. Analyze documents carefully and provide classification with reasoning.
+
+Respond in JSON format with two fields:
+- category: the chosen category name
+- reasoning: brief explanation (1-2 sentences) why this category was chosen"""
+
+
+@lru_cache(maxsize=32)
+def _category_lookup(categories: Tuple[str, ...]) -> Tuple[str, Tuple[Tuple[str, str], ...], Optional[str]]:
+    """Prompt text and matching data for a category list, built once per list.
+
+    Returns:
+        (comma-joined categories, (lowercased, original) pairs, fallback category)
+    """
+    fallback = None
+    if categories:
+        fallback = categories[-1] if "other" in categories[-1].lower() else categories[0]
+    return ", ".join(categories), tuple((c.lower(), c) for c in categories), fallback
 
 
 class OllamaService:
     """Service for interacting with Ollama LLM for document classification."""
 
-    def __init__(self, host: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        model: Optional[str] = None,
+        hosts: Optional[List[str]] = None,
+    ):
         """Initialize Ollama service.
 
         Args:
             host: Ollama API host URL (defaults to settings)
             model: Model name to use (defaults to settings)
+            hosts: Ollama host URLs to round-robin over (overrides host)
         """
-        self.host = host or settings.ollama_host
+        if hosts:
+            self.hosts = list(hosts)
+        else:
+            self.hosts = [host] if host else settings.ollama_hosts_list
+        self.host = self.hosts[0]
         self.model = model or settings.ollama_model
         self.api_url = f"{self.host}/api/generate"
         self.api_chat_url = f"{self.host}/api/chat"
 
+        # Reused across calls so connections to each host stay open
+        self.session = create_http_session()
+
+        # Round-robin state and per-host health (EWMA of request failures)
+        self._lock = threading.Lock()
+        self._rotation = itertools.cycle(self.hosts)
+        self._error_rate = {h: 0.0 for h in self.hosts}
+        self._quarantined_until = {h: 0.0 for h in self.hosts}
+
+    def _next_host(self) -> str:
+        """Pick the next healthy host, round-robin.
+
+        Quarantined hosts are skipped; if every host is quarantined the
+        next one in rotation is tried anyway.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for _ in range(len(self.hosts)):
+                host = next(self._rotation)
+                if self._quarantined_until[host] <= now:
+                    return host
+            return next(self._rotation)
+
+    def _record_result(self, host: str, success: bool) -> None:
+        """Update a host's error rate and quarantine it if it is failing."""
+        with self._lock:
+            rate = (1 - ERROR_RATE_ALPHA) * self._error_rate[host] + ERROR_RATE_ALPHA * (not success)
+            self._error_rate[host] = rate
+            if rate > ERROR_RATE_THRESHOLD and len(self.hosts) > 1:
+                self._quarantined_until[host] = time.monotonic() + QUARANTINE_SECONDS
+                logger.warning(f"Ollama host {host} quarantined for {QUARANTINE_SECONDS:.0f}s (error rate {rate:.2f})")
+
+    def _post(self, path: str, payload: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """POST to the next healthy host and return the decoded JSON body."""
+        host = self._next_host()
+        try:
+            response = self.session.post(f"{host}{path}", json=payload, timeout=timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            self._record_result(host, success=False)
+            raise
+        self._record_result(host, success=True)
+        return parse_json_response(response)
+
     def is_available(self) -> bool:
         """Check if Ollama service is available."""
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
+            response = self.session.get(f"{self.host}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Ollama service not available: {e}")
@@ -35,7 +122,7 @@ class OllamaService:
     def list_models(self) -> List[str]:
         """List available Ollama models."""
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=10)
+            response = self.session.get(f"{self.host}/api/tags", timeout=10)
             response.raise_for_status()
             models = response.json().get("models", [])
             return [model.get("name") for model in models]
@@ -75,11 +162,8 @@ class OllamaService:
             if system_prompt:
                 payload["system"] = system_prompt
 
-            logger.debug(f"Sending request to Ollama: {self.model}")
-            response = requests.post(self.api_url, json=payload, timeout=120)
-            response.raise_for_status()
-
-            result = response.json()
+            logger.debug("Sending request to Ollama: {}", self.model)
+            result = self._post("/api/generate", payload, timeout=120)
             return result.get("response", "").strip()
 
         except requests.exceptions.Timeout:
@@ -119,11 +203,8 @@ class OllamaService:
                 },
             }
 
-            logger.debug(f"Sending chat request to Ollama: {self.model}")
-            response = requests.post(self.api_chat_url, json=payload, timeout=120)
-            response.raise_for_status()
-
-            result = response.json()
+            logger.debug("Sending chat request to Ollama: {}", self.model)
+            result = self._post("/api/chat", payload, timeout=120)
             return result.get("message", {}).get("content", "").strip()
 
         except requests.exceptions.Timeout:
@@ -159,11 +240,7 @@ class OllamaService:
             content = content[:half] + "\n\n...[truncated]...\n\n" + content[-half:]
 
         # Build classification prompt
-        system_prompt = """You are an expert document classifier. Your task is to analyze documents and classify them into the most appropriate category based on their content, structure, and metadata.
-
-Be precise and consistent. Only respond with the category name, nothing else."""
-
-        categories_str = ", ".join(categories)
+        categories_str, lowered_categories, fallback = _category_lookup(tuple(categories))
 
         prompt = f"""Analyze the following document and classify it into ONE of these categories: {categories_str}
 
@@ -186,7 +263,7 @@ Category:"""
         try:
             result = self.generate(
                 prompt=prompt,
-                system_prompt=system_prompt,
+                system_prompt=CLASSIFY_SYSTEM_PROMPT,
                 temperature=0.1,
                 max_tokens=50,
             )
@@ -198,14 +275,14 @@ Category:"""
             category = result.strip().lower()
 
             # Try to match to one of the valid categories
-            for valid_cat in categories:
-                if valid_cat.lower() in category or category in valid_cat.lower():
-                    logger.success(f"Classified as: {valid_cat}")
+            for lowered, valid_cat in lowered_categories:
+                if lowered in category or category in lowered:
+                    logger.debug("Classified as: {}", valid_cat)
                     return valid_cat
 
             # If no exact match, return the first category (fallback)
             logger.warning(f"Could not match category '{result}', using fallback")
-            return categories[-1] if "other" in categories[-1].lower() else categories[0]
+            return fallback
 
         except Exception as e:
             logger.error(f"Classification failed: {e}")
@@ -232,13 +309,7 @@ Category:"""
             half = max_content_length // 2
             content = content[:half] + "\n\n...[truncated]...\n\n" + content[-half:]
 
-        system_prompt = """You are an expert document classifier. Analyze documents carefully and provide classification with reasoning.
-
-Respond in JSON format with two fields:
-- category: the chosen category name
-- reasoning: brief explanation (1-2 sentences) why this category was chosen"""
-
-        categories_str = ", ".join(categories)
+        categories_str, lowered_categories, fallback = _category_lookup(tuple(categories))
 
         prompt = f"""Analyze this document and classify it into ONE category: {categories_str}
 
@@ -259,7 +330,7 @@ JSON Response:"""
         try:
             result = self.generate(
                 prompt=prompt,
-                system_prompt=system_prompt,
+                system_prompt=CLASSIFY_WITH_REASONING_SYSTEM_PROMPT,
                 temperature=0.1,
                 max_tokens=150,
             )
@@ -284,15 +355,13 @@ JSON Response:"""
             reasoning = response_data.get("reasoning", "").strip()
 
             # Validate category
-            matched_category = None
-            for valid_cat in categories:
-                if valid_cat.lower() in category.lower() or category.lower() in valid_cat.lower():
+            matched_category = fallback
+            category = category.lower()
+            for lowered, valid_cat in lowered_categories:
+                if lowered in category or category in lowered:
                     matched_category = valid_cat
                     break
 
-            if not matched_category:
-                matched_category = categories[-1] if "other" in categories[-1].lower() else categories[0]
-
             return {
                 "category": matched_category,
                 "reasoning": reasoning,
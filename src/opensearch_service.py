@@ -108,22 +108,97 @@ AUTHOR: AI Document Pipeline Team
 LAST UPDATED: November 2025
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from queue import Queue, Empty
+import json
 import logging
+import threading
 
 try:
     from opensearchpy import OpenSearch, helpers
-    from opensearchpy.exceptions import NotFoundError, RequestError
+    from opensearchpy.exceptions import NotFoundError, RequestError, SerializationError
+    from opensearchpy.serializer import JSONSerializer
     OPENSEARCH_AVAILABLE = True
 except ImportError:
     OPENSEARCH_AVAILABLE = False
 
 from src.embedding_service import EmbeddingService
+from src.json_utils import ORJSON_AVAILABLE, dumps as json_dumps, loads as json_loads
 
 logger = logging.getLogger(__name__)
 
+# Longest text sent to the embedding model. nomic-embed-text (Ollama) fails
+# beyond ~2500 chars; text-embedding-3-small (OpenAI) allows ~32000 chars.
+EMBEDDING_MAX_CHARS = 2000
+
+# The only _source fields SearchResult reads. Search hits return just these;
+# full_content (and metadata_json) can be megabytes per hit and are never
+# used, and highlighting still runs server-side against the stored source.
+_RESULT_SOURCE_FIELDS = [
+    "id", "file_name", "file_path", "category", "title", "author", "content_preview",
+]
+
+# Bounded hand-off between the embedding and indexing stages of bulk indexing
+_PIPELINE_QUEUE_SIZE = 64
+_PIPELINE_DONE = object()
+
+# Schema fields that make up the embedding text for structured categories.
+# For these documents the raw text mostly repeats the extracted fields, so
+# embedding a short canonical sentence is cheaper and less noisy. Other
+# categories embed their full content.
+_CANONICAL_EMBEDDING_FIELDS = {
+    "invoices": (
+        ("Invoice", "invoice_number"),
+        ("from", "vendor_name"),
+        ("to", "customer_name"),
+        ("total", "total_amount"),
+        ("", "currency"),
+        ("dated", "invoice_date"),
+        ("due", "due_date"),
+        ("status", "payment_status"),
+        ("for", "description"),
+    ),
+    "purchase_orders": (
+        ("Purchase order", "po_number"),
+        ("from", "buyer_name"),
+        ("to", "vendor_name"),
+        ("total", "total_amount"),
+        ("", "currency"),
+        ("dated", "po_date"),
+        ("status", "po_status"),
+        ("delivery", "requested_delivery_date"),
+        ("project", "project_code"),
+    ),
+}
+
+
+if OPENSEARCH_AVAILABLE and ORJSON_AVAILABLE:
+    class OrjsonSerializer(JSONSerializer):
+        """
+        Request/response serializer backed by orjson.
+
+        Every indexed document (including its 768+ float embedding) and every
+        search response passes through here, so the C encoder/decoder is a
+        measurable win over stdlib json. Returns str because the bulk helper
+        joins serialized actions as text.
+        """
+
+        def dumps(self, data):
+            if isinstance(data, (str, bytes)):
+                return data
+            try:
+                return json_dumps(data, default=self.default)
+            except (ValueError, TypeError) as e:
+                raise SerializationError(data, e)
+
+        def loads(self, s):
+            try:
+                return json_loads(s)
+            except ValueError as e:
+                raise SerializationError(s, e)
+
 
 # ==============================================================================
 # ENUMS AND DATA CLASSES
@@ -219,7 +294,8 @@ class OpenSearchService:
             http_auth=http_auth,
             use_ssl=use_ssl,
             verify_certs=verify_certs,
-            ssl_show_warn=False
+            ssl_show_warn=False,
+            **({"serializer": OrjsonSerializer()} if ORJSON_AVAILABLE else {})
         )
 
         self.embedding_service = embedding_service
@@ -233,7 +309,8 @@ class OpenSearchService:
         self,
         index_name: str = "documents",
         dimension: int = 768,
-        force_recreate: bool = False
+        force_recreate: bool = False,
+        quantize_vectors: bool = False
     ) -> bool:
         """
         Create OpenSearch index with proper mappings.
@@ -242,6 +319,10 @@ class OpenSearchService:
             index_name: Name of the index
             dimension: Embedding vector dimension (768 for nomic-embed-text)
             force_recreate: Delete existing index if it exists
+            quantize_vectors: Store vectors int8 scalar-quantized with the
+                Lucene engine. Requires OpenSearch 2.16+ (the pinned 2.11
+                rejects the "sq" encoder); on older servers a warning is
+                logged and full-precision nmslib vectors are used instead
 
         Returns:
             True if successful
@@ -257,6 +338,38 @@ class OpenSearchService:
                 logger.info(f"Index already exists: {index_name}")
                 return True
 
+            # HNSW graph for the embedding field. Scalar quantization stores
+            # each float32 dimension as int8 inside Lucene (~4x smaller graph,
+            # less memory bandwidth per hop); queries still send float vectors.
+            if quantize_vectors and self._server_version() < (2, 16):
+                logger.warning(
+                    "Vector quantization needs OpenSearch 2.16+; "
+                    "creating full-precision index instead"
+                )
+                quantize_vectors = False
+
+            if quantize_vectors:
+                vector_method = {
+                    "name": "hnsw",
+                    "space_type": "cosinesimil",
+                    "engine": "lucene",
+                    "parameters": {
+                        "ef_construction": 128,
+                        "m": 16,
+                        "encoder": {"name": "sq"}
+                    }
+                }
+            else:
+                vector_method = {
+                    "name": "hnsw",
+                    "space_type": "cosinesimil",
+                    "engine": "nmslib",
+                    "parameters": {
+                        "ef_construction": 128,
+                        "m": 24
+                    }
+                }
+
             # Index mappings
             index_body = {
                 "settings": {
@@ -275,6 +388,12 @@ class OpenSearchService:
                     }
                 },
                 "mappings": {
+                    # Vectors are served from the k-NN index, not _source.
+                    # Keeping ~3 KB of float JSON out of every stored document
+                    # shrinks disk usage and fetch payloads.
+                    "_source": {
+                        "excludes": ["embedding"]
+                    },
                     "properties": {
                         # Document identifiers
                         "id": {"type": "integer"},
@@ -323,15 +442,7 @@ class OpenSearchService:
                         "embedding": {
                             "type": "knn_vector",
                             "dimension": dimension,
-                            "method": {
-                                "name": "hnsw",
-                                "space_type": "cosinesimil",
-                                "engine": "nmslib",
-                                "parameters": {
-                                    "ef_construction": 128,
-                                    "m": 24
-                                }
-                            }
+                            "method": vector_method
                         },
 
                         # Structured metadata (flexible JSON)
@@ -394,7 +505,7 @@ class OpenSearchService:
         try:
             # Generate embedding if requested
             if generate_embedding and self.embedding_service:
-                content = document.get("full_content", "")
+                content = self._embedding_text(document)
                 if content:
                     embedding = self.embedding_service.embed_text(content)
                     if embedding:
@@ -439,70 +550,83 @@ class OpenSearchService:
             Dict with success/failure counts
         """
         try:
-            # Generate embeddings if requested (with fault tolerance)
-            if generate_embeddings and self.embedding_service:
-                logger.info("Generating embeddings for bulk indexing...")
-                embedding_errors = 0
-                embedding_success = 0
-
-                for i, doc in enumerate(documents):
-                    content = doc.get("full_content", "")
-                    # Generate embedding if missing or None
-                    if content and (not doc.get("embedding") or doc.get("embedding") is None):
-                        # Truncate very long content to prevent embedding API failures
-                        # nomic-embed-text (Ollama) has ~2500 char limit
-                        # text-embedding-3-small (OpenAI) has ~8000 token limit (~32000 chars)
-                        max_content_length = 2000  # Safe limit for nomic-embed-text
-                        if len(content) > max_content_length:
-                            logger.warning(
-                                f"Document {doc.get('id')} content too long ({len(content)} chars), "
-                                f"truncating to {max_content_length} chars"
-                            )
-                            content = content[:max_content_length]
-
-                        try:
-                            embedding = self.embedding_service.embed_text(content)
-                            if embedding:
-                                doc["embedding"] = embedding
-                                embedding_success += 1
-                            else:
-                                embedding_errors += 1
-                                logger.warning(f"Empty embedding returned for document {doc.get('id')}")
-                        except Exception as e:
-                            embedding_errors += 1
-                            logger.error(f"Failed to generate embedding for document {doc.get('id')}: {e}")
-                            # Continue processing - document will be indexed without embedding
+            # Embedding (slow, remote) and bulk indexing run as a two-stage
+            # pipeline: a producer thread embeds documents into a bounded
+            # queue while helpers.bulk() drains it chunk by chunk, so the
+            # OpenSearch write for chunk N overlaps the embedding calls for
+            # chunk N+1. Total time approaches the slower stage instead of
+            # the sum of both.
+            embed = generate_embeddings and self.embedding_service is not None
+            if embed:
+                logger.info("Generating embeddings for bulk indexing (pipelined with indexing)...")
+
+            embedding_stats = {"success": 0, "errors": 0}
+            pipeline: Queue = Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+            stop = threading.Event()
+
+            def embed_stage():
+                try:
+                    for doc in documents:
+                        if stop.is_set():
+                            break
+                        if embed:
+                            embedded = self._embed_for_bulk(doc)
+                            if embedded is True:
+                                embedding_stats["success"] += 1
+                            elif embedded is False:
+                                embedding_stats["errors"] += 1
+                        pipeline.put(doc)
+                finally:
+                    pipeline.put(_PIPELINE_DONE)
+
+            def index_stage():
+                while True:
+                    doc = pipeline.get()
+                    if doc is _PIPELINE_DONE:
+                        return
+
+                    doc_id = doc.get("id")
+                    if not doc_id:
+                        logger.warning("Skipping document without ID")
+                        continue
+
+                    # No per-action "_index": the index goes in the bulk
+                    # URL once, so it isn't repeated in every action line
+                    yield {
+                        "_id": doc_id,
+                        "_source": doc
+                    }
 
+            producer = threading.Thread(target=embed_stage, name="bulk-embed", daemon=True)
+            producer.start()
+
+            try:
+                # Execute bulk indexing with fault tolerance
+                success, failed = helpers.bulk(
+                    self.client,
+                    index_stage(),
+                    index=index_name,
+                    chunk_size=chunk_size,
+                    raise_on_error=False,
+                    stats_only=False,
+                    max_retries=3,
+                    initial_backoff=2
+                )
+            finally:
+                # Unblock the producer if indexing stopped early
+                stop.set()
+                while producer.is_alive():
+                    try:
+                        pipeline.get_nowait()
+                    except Empty:
+                        producer.join(timeout=0.1)
+
+            if embed:
                 logger.info(
-                    f"Embedding generation complete: {embedding_success} success, "
-                    f"{embedding_errors} errors (documents will be indexed without embeddings)"
+                    f"Embedding generation complete: {embedding_stats['success']} success, "
+                    f"{embedding_stats['errors']} errors (documents will be indexed without embeddings)"
                 )
 
-            # Prepare bulk actions
-            actions = []
-            for doc in documents:
-                doc_id = doc.get("id")
-                if not doc_id:
-                    logger.warning("Skipping document without ID")
-                    continue
-
-                actions.append({
-                    "_index": index_name,
-                    "_id": doc_id,
-                    "_source": doc
-                })
-
-            # Execute bulk indexing with fault tolerance
-            success, failed = helpers.bulk(
-                self.client,
-                actions,
-                chunk_size=chunk_size,
-                raise_on_error=False,
-                stats_only=False,
-                max_retries=3,
-                initial_backoff=2
-            )
-
             # Log failures with details for debugging
             if failed:
                 logger.warning(f"Bulk indexed: {success} succeeded, {len(failed)} failed")
@@ -528,6 +652,75 @@ class OpenSearchService:
             logger.error(f"Bulk indexing failed: {e}")
             return {"success": 0, "failed": len(documents), "total": len(documents)}
 
+    def _embed_for_bulk(self, doc: Dict[str, Any]) -> Optional[bool]:
+        """
+        Generate the embedding for one document during bulk indexing.
+
+        Returns:
+            True if an embedding was added, False if generation failed,
+            None if the document did not need one
+        """
+        # Generate embedding if missing or None
+        if doc.get("embedding"):
+            return None
+        content = self._embedding_text(doc)
+        if not content:
+            return None
+
+        try:
+            embedding = self.embedding_service.embed_text(content)
+            if embedding:
+                doc["embedding"] = embedding
+                return True
+            logger.warning(f"Empty embedding returned for document {doc.get('id')}")
+            return False
+        except Exception as e:
+            # Continue processing - document will be indexed without embedding
+            logger.error(f"Failed to generate embedding for document {doc.get('id')}: {e}")
+            return False
+
+    @staticmethod
+    def _embedding_text(doc: Dict[str, Any], max_chars: int = EMBEDDING_MAX_CHARS) -> str:
+        """
+        Build the text to embed for a document, at most max_chars long.
+
+        Structured categories (see _CANONICAL_EMBEDDING_FIELDS) use a compact
+        sentence built from their extracted fields; everything else, and any
+        document whose extraction produced none of those fields, uses
+        full_content. The budget is checked while building, so no oversized
+        intermediate string is created and then sliced.
+        """
+        fields = _CANONICAL_EMBEDDING_FIELDS.get((doc.get("category") or "").lower())
+        metadata = doc.get("metadata_json")
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except ValueError:
+                metadata = None
+
+        if fields and isinstance(metadata, dict):
+            parts = []
+            remaining = max_chars
+            for label, key in fields:
+                value = metadata.get(key)
+                if value in (None, ""):
+                    continue
+                part = f"{label} {value}" if label else str(value)
+                if len(part) > remaining:
+                    break
+                parts.append(part)
+                remaining -= len(part) + 1
+            if parts:
+                return " ".join(parts)
+
+        content = doc.get("full_content") or ""
+        if len(content) > max_chars:
+            logger.debug(
+                f"Document {doc.get('id')} content too long ({len(content)} chars), "
+                f"truncating to {max_chars} chars for embedding"
+            )
+        return content[:max_chars]
+
     # ==========================================================================
     # SEARCH OPERATIONS
     # ==========================================================================
@@ -581,7 +774,7 @@ class OpenSearchService:
                 "from": offset,
                 "size": limit,
                 "_source": {
-                    "excludes": ["embedding"]  # Don't return large vectors
+                    "includes": _RESULT_SOURCE_FIELDS  # No vectors or full content
                 }
             }
 
@@ -677,7 +870,7 @@ class OpenSearchService:
                     }
                 },
                 "_source": {
-                    "excludes": ["embedding"]
+                    "includes": _RESULT_SOURCE_FIELDS
                 }
             }
 
@@ -907,6 +1100,15 @@ class OpenSearchService:
     # HEALTH AND MONITORING
     # ==========================================================================
 
+    def _server_version(self) -> Tuple[int, ...]:
+        """OpenSearch server version as a tuple, e.g. (2, 11, 1); (0,) if unknown."""
+        try:
+            number = self.client.info()["version"]["number"]
+            return tuple(int(part) for part in number.split("-")[0].split("."))
+        except Exception as e:
+            logger.warning(f"Could not determine OpenSearch version: {e}")
+            return (0,)
+
     def health_check(self) -> Dict[str, Any]:
         """Check OpenSearch cluster health."""
         try:
@@ -922,17 +1124,52 @@ class OpenSearchService:
             logger.error(f"Health check failed: {e}")
             return {"status": "unhealthy", "error": str(e)}
 
+    def count_documents(
+        self,
+        index_name: str = "documents",
+        query: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Count matching documents server-side with _count (no hits fetched).
+
+        Args:
+            index_name: Index to count in
+            query: OpenSearch query clause (default: all documents)
+
+        Returns:
+            Number of matching documents, or -1 if the count failed
+        """
+        try:
+            body = {"query": query} if query else None
+            return self.client.count(index=index_name, body=body)["count"]
+        except Exception as e:
+            logger.error(f"Failed to count documents: {e}")
+            return -1
+
     def get_index_stats(self, index_name: str = "documents") -> Dict[str, Any]:
         """Get index statistics."""
         try:
             stats = self.client.indices.stats(index=index_name)
             index_stats = stats["indices"][index_name]
+            document_count = index_stats["total"]["docs"]["count"]
+            # _count below covers primary shards only; "total" also counts
+            # replica copies, which would halve the coverage ratio
+            primary_count = index_stats["primaries"]["docs"]["count"]
+
+            # Counted server-side; no document or vector is transferred
+            with_embeddings = self.count_documents(
+                index_name, {"exists": {"field": "embedding"}}
+            )
 
             return {
-                "document_count": index_stats["total"]["docs"]["count"],
+                "document_count": document_count,
                 "deleted_count": index_stats["total"]["docs"]["deleted"],
                 "store_size_bytes": index_stats["total"]["store"]["size_in_bytes"],
-                "store_size_mb": round(index_stats["total"]["store"]["size_in_bytes"] / (1024 * 1024), 2)
+                "store_size_mb": round(index_stats["total"]["store"]["size_in_bytes"] / (1024 * 1024), 2),
+                "documents_with_embeddings": max(with_embeddings, 0),
+                "embedding_coverage": (
+                    f"{(with_embeddings / primary_count * 100):.1f}%"
+                    if primary_count > 0 and with_embeddings > 0 else "0%"
+                ),
             }
         except Exception as e:
             logger.error(f"Failed to get index stats: {e}")
@@ -78,18 +78,21 @@ LAST UPDATED: October 2025
 import multiprocessing as mp
 from multiprocessing import Pool, Queue, Manager
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import time
 import os
 import signal
+import sys
 from loguru import logger
 from tqdm import tqdm
 
 from src.classifier import DocumentClassifier, ClassificationResult
 from src.ollama_service import OllamaService
 from src.extractors import ExtractionService
+from src.file_scanner import scan_documents
+from src.json_utils import write_json
 
 
 # ==============================================================================
@@ -189,12 +192,82 @@ class ProcessingStats:
 # WORKER FUNCTIONS
 # ==============================================================================
 
+# Classifiers built once per worker process, keyed on (use_database, database_url)
+_worker_classifiers: Dict[Tuple[bool, Optional[str]], DocumentClassifier] = {}
+
+# The parent's settings, handed to this worker by _init_worker
+_worker_settings = None
+
+
+def _init_worker(parent_settings, use_database: bool, database_url: Optional[str]):
+    """
+    Pool initializer: runs once in each worker process before any documents.
+
+    Does two things:
+    1. Keeps the parent's settings object for this worker's services
+    2. Builds the worker's service instances once
+
+    Why the parent's settings?
+    - With the "fork" start method (Linux) the worker already shares them
+    - With "spawn" (macOS, Windows) the worker re-imports config and
+      builds a fresh Settings from .env, losing runtime overrides such
+      as CLI --categories
+    - The parent's instance arrives pickled and is passed explicitly to
+      the services built here; no module globals are patched
+
+    Why build services here?
+    - Creating OllamaService, ExtractionService and DocumentClassifier
+      for every document repeats the same setup thousands of times
+    - Each worker is a separate process, so one set per worker is safe
+
+    Args:
+        parent_settings: The parent process's config.settings instance
+        use_database: Whether the classifier saves results to database
+        database_url: Database connection string (if using database)
+    """
+    global _worker_settings
+
+    _worker_settings = parent_settings
+    _worker_classifiers[(use_database, database_url)] = _build_worker_classifier(
+        parent_settings, use_database, database_url
+    )
+
+
+def _build_worker_classifier(
+    worker_settings, use_database: bool, database_url: Optional[str]
+) -> DocumentClassifier:
+    """Create the classifier and services a worker process uses, from worker_settings."""
+    # Each worker is a SEPARATE PROCESS with its own memory.
+    # We can't share objects between processes, so each worker
+    # needs its own copy of the services.
+    ollama = OllamaService(
+        hosts=worker_settings.ollama_hosts_list,
+        model=worker_settings.ollama_model,
+    )
+    extractor = ExtractionService()
+    classifier = DocumentClassifier(
+        ollama_service=ollama,
+        extraction_service=extractor,
+        use_database=use_database
+    )
+    classifier.categories = worker_settings.category_list
+    classifier.store_full_content = worker_settings.store_full_content
+
+    # If database is enabled, give this worker its own database connection.
+    # Each worker needs its own connection (can't share connections between processes).
+    if use_database and classifier.db:
+        from src.database import DatabaseService
+        classifier.db = DatabaseService(database_url=database_url)
+
+    return classifier
+
+
 def _worker_process_document(args):
     """
     Worker function that processes a single document in a separate process.
 
     This is the function that runs in each worker process. Each worker:
-    1. Creates its own classifier instance (can't share between processes)
+    1. Uses its own classifier instance, built once by _init_worker
     2. Extracts text from the document
     3. Classifies it with AI
     4. Optionally saves to database
@@ -246,27 +319,28 @@ def _worker_process_document(args):
     file_path, categories, include_reasoning, use_database, database_url = args
 
     try:
-        # Step 1: Create service instances for THIS worker
+        # Step 1-2: Get this worker's service instances
         #
-        # Why create new instances instead of reusing?
-        # Each worker is a SEPARATE PROCESS with its own memory.
-        # We can't share objects between processes.
-        # Each worker needs its own copy of the services.
-        ollama = OllamaService()
-        extractor = ExtractionService()
-        classifier = DocumentClassifier(
-            ollama_service=ollama,
-            extraction_service=extractor,
-            use_database=use_database
-        )
+        # Built once per process by _init_worker and reused for every
+        # document the worker handles. Keyed on the database arguments,
+        # so a document sent with different ones gets a matching
+        # classifier (built here on first use, as when the function is
+        # called outside a pool initialized by ParallelDocumentProcessor).
+        key = (use_database, database_url)
+        classifier = _worker_classifiers.get(key)
+        if classifier is None:
+            if _worker_settings is None:
+                from config import settings as worker_settings
+            else:
+                worker_settings = _worker_settings
+            classifier = _worker_classifiers[key] = _build_worker_classifier(
+                worker_settings, use_database, database_url
+            )
 
-        # Step 2: Configure database connection if needed
-        #
-        # If database is enabled, give this worker its own database connection.
-        # Each worker needs its own connection (can't share connections between processes).
-        if use_database and classifier.db:
-            from src.database import DatabaseService
-            classifier.db = DatabaseService(database_url=database_url)
+        # Categories travel with each document (the CLI's --categories
+        # reaches workers only this way), so apply them per call
+        if categories:
+            classifier.categories = tuple(categories)
 
         # Step 3: Classify the document
         #
@@ -276,6 +350,12 @@ def _worker_process_document(args):
         # - Save to database (if enabled)
         result = classifier.classify_document(file_path, include_reasoning)
 
+        # The classifier outlives this document, and classify_document
+        # appends every result to classifier.results. The parent process
+        # collects results from our return value, so drop the worker's
+        # copy or it grows for the whole run.
+        classifier.clear_results()
+
         # Step 4: Convert result to dictionary for return
         #
         # Why convert to dict?
@@ -540,7 +620,14 @@ class ParallelDocumentProcessor:
         #
         # The "with" statement ensures workers are cleaned up properly.
         try:
-            with Pool(processes=self.num_workers) as pool:
+            # initializer runs once per worker: hands it this process's
+            # settings and builds the worker's services (see _init_worker)
+            from config import settings
+            with Pool(
+                processes=self.num_workers,
+                initializer=_init_worker,
+                initargs=(settings, self.use_database, self.database_url),
+            ) as pool:
                 if show_progress:
                     # Option A: Show progress bar (slower but user-friendly)
                     #
@@ -681,33 +768,21 @@ class ParallelDocumentProcessor:
         """
         logger.info(f"Scanning directory: {input_dir}")
 
-        # Step 1: Determine which file types to process
+        # Steps 1-3: Collect all matching files
         #
-        # Default to all supported document types.
-        # User can override to process only specific types.
-        if file_extensions is None:
-            file_extensions = [".pdf", ".docx", ".doc", ".xlsx", ".xls", ".txt", ".md"]
-
-        # Step 2: Collect all matching files
-        #
-        # Two modes:
-        # - Recursive (rglob): Search all subdirectories
-        # - Non-recursive (glob): Only search top level
-        file_paths = []
-        if recursive:
-            # rglob searches recursively (all subdirectories)
-            for ext in file_extensions:
-                file_paths.extend(input_dir.rglob(f"*{ext}"))
-        else:
-            # glob searches only the specified directory
-            for ext in file_extensions:
-                file_paths.extend(input_dir.glob(f"*{ext}"))
-
-        # Step 3: Filter to only files (exclude directories)
+        # file_extensions defaults to all supported document types; the
+        # user can override to process only specific types.
         #
-        # Sometimes glob returns directories that match the pattern.
-        # We only want actual files.
-        file_paths = [f for f in file_paths if f.is_file()]
+        # One directory walk covers every extension (rather than one
+        # rglob per extension), returns only regular files, and skips
+        # files over settings.max_file_size_mb.
+        from config import settings
+        file_paths = scan_documents(
+            input_dir,
+            extensions=file_extensions,
+            recursive=recursive,
+            max_size_bytes=settings.max_file_size_bytes,
+        )
 
         logger.info(f"Found {len(file_paths)} documents to process")
 
@@ -825,8 +900,6 @@ class ParallelDocumentProcessor:
         - Human-readable format
         - Can be imported into databases or spreadsheets
         """
-        import json
-
         # Build export data structure
         export_data = {
             "stats": self.stats.to_dict() if self.stats else {},
@@ -836,8 +909,7 @@ class ParallelDocumentProcessor:
         }
 
         # Write to file with nice formatting (indent=2)
-        with open(output_path, "w") as f:
-            json.dump(export_data, f, indent=2)
+        write_json(output_path, export_data)
 
         logger.success(f"Exported results to {output_path}")
 
@@ -877,23 +949,30 @@ class ParallelDocumentProcessor:
             logger.warning("No stats available - run processing first")
             return
 
-        print("\n" + "=" * 80)
-        print("PARALLEL PROCESSING SUMMARY")
-        print("=" * 80)
-        print(f"Total Documents:      {self.stats.total_documents:,}")
-        print(f"Successful:           {self.stats.successful:,}")
-        print(f"Failed:               {self.stats.failed:,}")
-        print(f"Success Rate:         {self.stats.successful/self.stats.total_documents:.1%}")
-        print(f"Worker Processes:     {self.stats.worker_count}")
-        print(f"Processing Time:      {self.stats.processing_time_seconds:.2f}s")
-        print(f"Throughput:           {self.stats.documents_per_second:.2f} documents/second")
+        # Build the whole report and write it once: one stdout lock and
+        # one write() instead of a print() call per line
+        lines = [
+            "",
+            "=" * 80,
+            "PARALLEL PROCESSING SUMMARY",
+            "=" * 80,
+            f"Total Documents:      {self.stats.total_documents:,}",
+            f"Successful:           {self.stats.successful:,}",
+            f"Failed:               {self.stats.failed:,}",
+            f"Success Rate:         {self.stats.successful/self.stats.total_documents:.1%}",
+            f"Worker Processes:     {self.stats.worker_count}",
+            f"Processing Time:      {self.stats.processing_time_seconds:.2f}s",
+            f"Throughput:           {self.stats.documents_per_second:.2f} documents/second",
+        ]
 
         # Calculate estimated time for 500K documents
         if self.stats.documents_per_second > 0:
             hours_for_500k = 500000 / self.stats.documents_per_second / 3600
-            print(f"Estimated for 500K:   {hours_for_500k:.1f} hours")
+            lines.append(f"Estimated for 500K:   {hours_for_500k:.1f} hours")
 
-        print("=" * 80)
+        lines.append("=" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 # ==============================================================================
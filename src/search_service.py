@@ -7,6 +7,7 @@ Provides:
 - Cloud-ready architecture
 """
 
+import re
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
@@ -18,6 +19,10 @@ from loguru import logger
 
 from src.embedding_service import EmbeddingService, EmbeddingProvider
 
+# Page markers written by the extractors, e.g. "[Page 6]"
+PAGE_MARKER_RE = re.compile(r'\[Page \d+\]')
+PAGE_SECTION_RE = re.compile(r'\[Page (\d+)\](.*?)(?=\[Page \d+\]|$)', re.DOTALL)
+
 
 class SearchMode(str, Enum):
     """Search modes."""
@@ -118,8 +123,7 @@ class SearchService:
             return ""
 
         # Check if document has page markers
-        import re
-        has_pages = bool(re.search(r'\[Page \d+\]', full_text))
+        has_pages = bool(PAGE_MARKER_RE.search(full_text))
 
         if has_pages:
             # Extract snippets per page for better readability
@@ -146,11 +150,8 @@ class SearchService:
         Returns:
             Snippets with page numbers, e.g., "[Page 6] REST API provides..."
         """
-        import re
-
         # Split into pages
-        page_pattern = r'\[Page (\d+)\](.*?)(?=\[Page \d+\]|$)'
-        pages = list(re.finditer(page_pattern, full_text, re.DOTALL))
+        pages = list(PAGE_SECTION_RE.finditer(full_text))
 
         # Find query terms in each page
         query_terms = [term.lower() for term in query.split() if len(term) >= 2]
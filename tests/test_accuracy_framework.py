@@ -4,13 +4,15 @@ Tests accuracy across all architectural boundaries: OCR, Extraction, Classificat
 """
 
 import asyncio
-import json
 import csv
+import math
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import lru_cache
 import statistics
+import time
 import logging
 
 from src.domain import load_configuration, Result
@@ -22,6 +24,7 @@ from src.services import (
     create_ollama_service,
 )
 from src.infrastructure import create_extraction_service
+from src.json_utils import read_json, write_json
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +40,29 @@ class GroundTruth:
     notes: str = ""
 
 
+@lru_cache(maxsize=8)
+def _load_ground_truth_cases(ground_truth_file: str, mtime_ns: int) -> Tuple[GroundTruth, ...]:
+    """Parse a ground truth file once per (path, modification time)."""
+    data = read_json(ground_truth_file)
+
+    return tuple(
+        GroundTruth(
+            file_path=Path(item['file_path']),
+            expected_category=item['expected_category'],
+            expected_text_keywords=item['expected_keywords'],
+            expected_confidence_min=item.get('expected_confidence_min', 0.7),
+            notes=item.get('notes', '')
+        )
+        for item in data['test_cases']
+    )
+
+
+@lru_cache(maxsize=1024)
+def _normalize_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Casefold expected keywords once per distinct keyword list."""
+    return tuple(keyword.casefold() for keyword in keywords)
+
+
 @dataclass
 class OCRAccuracyMetrics:
     """OCR accuracy measurements."""
@@ -105,6 +131,9 @@ class AccuracyTestFramework:
         self.classification_service = create_ollama_service(self.config)
         self.document_service = None  # Will be created async
         self.results: List[EndToEndMetrics] = []
+        # (path, mtime_ns, size) -> extraction Result, so classification and
+        # repeated runs reuse the content extracted for a file
+        self._extraction_cache: Dict[Tuple[str, int, int], Result] = {}
     
     async def initialize(self):
         """Initialize async services."""
@@ -115,20 +144,12 @@ class AccuracyTestFramework:
         )
     
     def load_ground_truth(self, ground_truth_file: Path) -> List[GroundTruth]:
-        """Load ground truth data from JSON file."""
+        """Load ground truth data from JSON file (parsed once until it changes)."""
         try:
-            with open(ground_truth_file, 'r') as f:
-                data = json.load(f)
-            
-            ground_truths = []
-            for item in data['test_cases']:
-                ground_truths.append(GroundTruth(
-                    file_path=Path(item['file_path']),
-                    expected_category=item['expected_category'],
-                    expected_text_keywords=item['expected_keywords'],
-                    expected_confidence_min=item.get('expected_confidence_min', 0.7),
-                    notes=item.get('notes', '')
-                ))
+            ground_truth_file = Path(ground_truth_file).resolve()
+            ground_truths = list(_load_ground_truth_cases(
+                str(ground_truth_file), ground_truth_file.stat().st_mtime_ns
+            ))
             
             logger.info(f"Loaded {len(ground_truths)} ground truth test cases")
             return ground_truths
@@ -137,9 +158,19 @@ class AccuracyTestFramework:
             logger.error(f"Failed to load ground truth: {e}")
             return []
     
+    async def _extract_content(self, file_path: Path) -> Result:
+        """Extract a file once per on-disk version; later calls hit the cache."""
+        stat = file_path.stat()
+        key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        result = self._extraction_cache.get(key)
+        if result is None:
+            result = await self.extraction_service.extract_content(file_path)
+            self._extraction_cache[key] = result
+        return result
+    
     async def test_ocr_accuracy(self, file_path: Path, expected_keywords: List[str]) -> OCRAccuracyMetrics:
         """Test OCR accuracy for image files."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             if not self.ocr_service.is_supported(str(file_path)):
@@ -155,7 +186,7 @@ class AccuracyTestFramework:
                 )
             
             result = await self.ocr_service.extract_text(str(file_path))
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             if not result.is_success:
                 return OCRAccuracyMetrics(
@@ -170,11 +201,12 @@ class AccuracyTestFramework:
                 )
             
             ocr_data = result.value
-            extracted_text = ocr_data.text.lower()
+            # casefold (not lower) so e.g. "STRASSE" matches "straße"
+            extracted_text = ocr_data.text.casefold()
             
             # Count keyword matches
-            keyword_matches = sum(1 for keyword in expected_keywords 
-                                if keyword.lower() in extracted_text)
+            keyword_matches = sum(1 for keyword in _normalize_keywords(tuple(expected_keywords))
+                                if keyword in extracted_text)
             
             return OCRAccuracyMetrics(
                 file_path=file_path,
@@ -187,7 +219,7 @@ class AccuracyTestFramework:
             )
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             return OCRAccuracyMetrics(
                 file_path=file_path,
                 success=False,
@@ -201,11 +233,11 @@ class AccuracyTestFramework:
     
     async def test_extraction_accuracy(self, file_path: Path) -> ExtractionAccuracyMetrics:
         """Test document extraction accuracy."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            result = await self.extraction_service.extract_content(file_path)
-            processing_time = (datetime.now() - start_time).total_seconds()
+            result = await self._extract_content(file_path)
+            processing_time = time.perf_counter() - start_time
             
             if not result.is_success:
                 return ExtractionAccuracyMetrics(
@@ -237,7 +269,7 @@ class AccuracyTestFramework:
             )
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             return ExtractionAccuracyMetrics(
                 file_path=file_path,
                 success=False,
@@ -254,13 +286,13 @@ class AccuracyTestFramework:
         expected_category: str
     ) -> ClassificationAccuracyMetrics:
         """Test classification accuracy."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             # First extract content
-            extraction_result = await self.extraction_service.extract_content(file_path)
+            extraction_result = await self._extract_content(file_path)
             if not extraction_result.is_success:
-                processing_time = (datetime.now() - start_time).total_seconds()
+                processing_time = time.perf_counter() - start_time
                 return ClassificationAccuracyMetrics(
                     file_path=file_path,
                     success=False,
@@ -280,7 +312,7 @@ class AccuracyTestFramework:
                 content, categories
             )
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             if not classification_result.is_success:
                 return ClassificationAccuracyMetrics(
@@ -309,7 +341,7 @@ class AccuracyTestFramework:
             )
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             return ClassificationAccuracyMetrics(
                 file_path=file_path,
                 success=False,
@@ -323,9 +355,9 @@ class AccuracyTestFramework:
     
     async def test_end_to_end(self, ground_truth: GroundTruth) -> EndToEndMetrics:
         """Run complete end-to-end test for a single document."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
-        logger.info(f"Testing: {ground_truth.file_path}")
+        logger.info("Testing: %s", ground_truth.file_path)
         
         # Test each layer
         ocr_metrics = None
@@ -341,7 +373,7 @@ class AccuracyTestFramework:
             ground_truth.expected_category
         )
         
-        total_time = (datetime.now() - start_time).total_seconds()
+        total_time = time.perf_counter() - start_time
         
         # Determine overall success
         overall_success = (
@@ -360,8 +392,8 @@ class AccuracyTestFramework:
             timestamp=datetime.now()
         )
     
-    async def run_accuracy_tests(self, ground_truth_file: Path) -> Dict[str, any]:
-        """Run complete accuracy test suite."""
+    async def run_accuracy_tests(self, ground_truth_file: Path, max_concurrency: int = 4) -> Dict[str, any]:
+        """Run complete accuracy test suite, up to max_concurrency documents at a time."""
         logger.info("Starting end-to-end accuracy testing")
         
         await self.initialize()
@@ -370,17 +402,29 @@ class AccuracyTestFramework:
         if not ground_truths:
             raise ValueError("No ground truth data loaded")
         
-        # Test each document
+        # Test documents concurrently; each test is dominated by OCR and
+        # Ollama round-trips, so up to max_concurrency run at once
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run_one(ground_truth: GroundTruth) -> Optional[EndToEndMetrics]:
+            async with semaphore:
+                try:
+                    return await self.test_end_to_end(ground_truth)
+                except Exception as e:
+                    logger.error("Test failed for %s: %s", ground_truth.file_path, e)
+                    return None
+        
+        existing = []
         for ground_truth in ground_truths:
-            if not ground_truth.file_path.exists():
-                logger.warning(f"Test file not found: {ground_truth.file_path}")
-                continue
-            
-            try:
-                metrics = await self.test_end_to_end(ground_truth)
+            if ground_truth.file_path.exists():
+                existing.append(ground_truth)
+            else:
+                logger.warning("Test file not found: %s", ground_truth.file_path)
+        
+        # gather keeps input order, so results stay in ground truth order
+        for metrics in await asyncio.gather(*(run_one(gt) for gt in existing)):
+            if metrics is not None:
                 self.results.append(metrics)
-            except Exception as e:
-                logger.error(f"Test failed for {ground_truth.file_path}: {e}")
         
         # Calculate summary statistics
         return self.calculate_accuracy_summary()
@@ -390,45 +434,70 @@ class AccuracyTestFramework:
         if not self.results:
             return {"error": "No test results available"}
         
-        # Overall metrics
+        # Single pass over the results: every counter and sum below is
+        # accumulated in the same iteration
         total_tests = len(self.results)
-        successful_tests = len([r for r in self.results if r.overall_success])
-        overall_accuracy = successful_tests / total_tests
-        
-        # OCR metrics
-        ocr_results = [r.ocr_metrics for r in self.results if r.ocr_metrics]
-        ocr_accuracy = len([o for o in ocr_results if o.success]) / len(ocr_results) if ocr_results else 0
-        avg_ocr_confidence = statistics.mean([o.confidence for o in ocr_results if o.confidence]) if ocr_results else 0
-        avg_keyword_accuracy = statistics.mean([o.keyword_accuracy for o in ocr_results]) if ocr_results else 0
-        
-        # Extraction metrics
-        extraction_results = [r.extraction_metrics for r in self.results]
-        extraction_accuracy = len([e for e in extraction_results if e.success]) / len(extraction_results)
-        avg_text_length = statistics.mean([e.text_length for e in extraction_results if e.success])
-        metadata_completeness = len([e for e in extraction_results if e.metadata_complete]) / len(extraction_results)
-        
-        # Classification metrics
-        classification_results = [r.classification_metrics for r in self.results]
-        classification_accuracy = len([c for c in classification_results if c.correct_prediction]) / len(classification_results)
-        avg_classification_confidence = statistics.mean([c.confidence for c in classification_results if c.confidence]) if classification_results else 0
-        
-        # Performance metrics
-        avg_processing_time = statistics.mean([r.total_processing_time for r in self.results])
-        
-        # Category breakdown
+        successful_tests = 0
+        ocr_tests = ocr_successes = 0
+        ocr_confidences: List[float] = []
+        keyword_accuracies: List[float] = []
+        extraction_successes = metadata_complete_count = 0
+        text_lengths: List[int] = []
+        correct_predictions = 0
+        classification_confidences: List[float] = []
+        processing_times: List[float] = []
         category_accuracy = {}
+        
         for result in self.results:
-            category = result.classification_metrics.expected_category
-            if category not in category_accuracy:
-                category_accuracy[category] = {"correct": 0, "total": 0}
+            if result.overall_success:
+                successful_tests += 1
+            processing_times.append(result.total_processing_time)
             
-            category_accuracy[category]["total"] += 1
-            if result.classification_metrics.correct_prediction:
-                category_accuracy[category]["correct"] += 1
+            # OCR metrics
+            ocr = result.ocr_metrics
+            if ocr:
+                ocr_tests += 1
+                if ocr.success:
+                    ocr_successes += 1
+                if ocr.confidence:
+                    ocr_confidences.append(ocr.confidence)
+                keyword_accuracies.append(ocr.keyword_accuracy)
+            
+            # Extraction metrics
+            extraction = result.extraction_metrics
+            if extraction.success:
+                extraction_successes += 1
+                text_lengths.append(extraction.text_length)
+            if extraction.metadata_complete:
+                metadata_complete_count += 1
+            
+            # Classification metrics and category breakdown
+            classification = result.classification_metrics
+            if classification.confidence:
+                classification_confidences.append(classification.confidence)
+            stats = category_accuracy.setdefault(
+                classification.expected_category, {"correct": 0, "total": 0}
+            )
+            stats["total"] += 1
+            if classification.correct_prediction:
+                correct_predictions += 1
+                stats["correct"] += 1
+        
+        overall_accuracy = successful_tests / total_tests
+        ocr_accuracy = ocr_successes / ocr_tests if ocr_tests else 0
+        avg_ocr_confidence = statistics.fmean(ocr_confidences) if ocr_confidences else 0
+        avg_keyword_accuracy = math.fsum(keyword_accuracies) / ocr_tests if ocr_tests else 0
+        extraction_accuracy = extraction_successes / total_tests
+        avg_text_length = statistics.fmean(text_lengths) if text_lengths else 0
+        metadata_completeness = metadata_complete_count / total_tests
+        classification_accuracy = correct_predictions / total_tests
+        avg_classification_confidence = (
+            statistics.fmean(classification_confidences) if classification_confidences else 0
+        )
+        avg_processing_time = math.fsum(processing_times) / total_tests
         
         # Calculate accuracy per category
-        for category in category_accuracy:
-            stats = category_accuracy[category]
+        for stats in category_accuracy.values():
             stats["accuracy"] = stats["correct"] / stats["total"]
         
         return {
@@ -442,7 +511,7 @@ class AccuracyTestFramework:
                 "ocr_accuracy": ocr_accuracy,
                 "average_confidence": avg_ocr_confidence,
                 "keyword_accuracy": avg_keyword_accuracy,
-                "tests_with_ocr": len(ocr_results),
+                "tests_with_ocr": ocr_tests,
             },
             "extraction_metrics": {
                 "extraction_accuracy": extraction_accuracy,
@@ -476,7 +545,8 @@ class AccuracyTestFramework:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for result in self.results:
+            # Sorted by file so exports from different runs diff cleanly
+            for result in sorted(self.results, key=lambda r: str(r.file_path)):
                 row = {
                     'file_path': str(result.file_path),
                     'overall_success': result.overall_success,
@@ -508,8 +578,7 @@ class AccuracyTestFramework:
     
     def export_summary_report(self, summary_data: Dict, output_path: Path):
         """Export summary report to JSON."""
-        with open(output_path, 'w') as f:
-            json.dump(summary_data, f, indent=2)
+        write_json(output_path, summary_data)
         
         logger.info(f"Summary report exported to: {output_path}")
 
@@ -523,6 +592,8 @@ async def main():
     parser.add_argument("--output-dir", type=Path, default=Path("test_results"), 
                        help="Output directory for results")
     parser.add_argument("--config", type=Path, help="Configuration file path")
+    parser.add_argument("--workers", type=int, default=4,
+                       help="Documents tested concurrently")
     
     args = parser.parse_args()
     
@@ -536,7 +607,7 @@ async def main():
     framework = AccuracyTestFramework(args.config)
     
     try:
-        summary = await framework.run_accuracy_tests(args.ground_truth)
+        summary = await framework.run_accuracy_tests(args.ground_truth, args.workers)
         
         # Export results
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
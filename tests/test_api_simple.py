@@ -7,6 +7,9 @@ import requests
 import json
 import time
 
+# One pooled keep-alive session for every request (no reconnect per call)
+http = requests.Session()
+
 def test_api_search():
     """Test the search API with different queries."""
     
@@ -17,7 +20,7 @@ def test_api_search():
     
     # Check if API is running
     try:
-        health_response = requests.get(f"{base_url}/health", timeout=5)
+        health_response = http.get(f"{base_url}/health", timeout=5)
         print(f"✅ API Health: {health_response.status_code}")
     except Exception as e:
         print(f"❌ API not accessible: {e}")
@@ -46,7 +49,7 @@ def test_api_search():
                 }
                 
                 start_time = time.time()
-                response = requests.get(f"{base_url}/api/search", params=params, timeout=10)
+                response = http.get(f"{base_url}/api/search", params=params, timeout=10)
                 response_time = (time.time() - start_time) * 1000
                 
                 if response.status_code == 200:
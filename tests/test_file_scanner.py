@@ -0,0 +1,36 @@
+"""Unit tests for document directory scanning."""
+
+from src.file_scanner import scan_documents
+
+
+class TestScanDocuments:
+    """Test scan_documents functionality."""
+
+    def test_recursive_scan(self, tmp_path):
+        """Test matching files are found in subdirectories, case-insensitively."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "report.PDF").write_text("x")
+        (tmp_path / "notes.txt").write_text("x")
+        (tmp_path / "photo.png").write_text("x")
+
+        assert scan_documents(tmp_path) == sorted([
+            tmp_path / "notes.txt",
+            tmp_path / "sub" / "report.PDF",
+        ])
+
+    def test_non_recursive_scan(self, tmp_path):
+        """Test subdirectories are skipped when recursive=False."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "report.pdf").write_text("x")
+        (tmp_path / "notes.txt").write_text("x")
+
+        assert scan_documents(tmp_path, recursive=False) == [tmp_path / "notes.txt"]
+
+    def test_extensions_and_size_limit(self, tmp_path):
+        """Test extension filtering and skipping files over the size limit."""
+        (tmp_path / "small.pdf").write_text("x")
+        (tmp_path / "large.pdf").write_text("x" * 100)
+        (tmp_path / "notes.txt").write_text("x")
+
+        result = scan_documents(tmp_path, extensions=[".pdf"], max_size_bytes=10)
+        assert result == [tmp_path / "small.pdf"]
@@ -0,0 +1,26 @@
+"""Unit tests for JSON encoding helpers."""
+
+import json
+from datetime import date
+
+from src.json_utils import dumps, loads, read_json, write_json
+
+
+class TestJsonUtils:
+    """Test json_utils functionality."""
+
+    def test_write_and_read_roundtrip(self, tmp_path):
+        """Test exports are indented like json.dump(indent=2) and read back."""
+        data = {"results": [{"category": "invoices", "confidence": 0.9}]}
+        output_path = tmp_path / "results.json"
+
+        write_json(output_path, data)
+
+        assert output_path.read_text() == json.dumps(data, indent=2)
+        assert read_json(output_path) == data
+
+    def test_dumps_default_and_loads_bytes(self):
+        """Test non-JSON types go through default and bytes are parsed."""
+        text = dumps({"day": date(2024, 1, 2)}, default=str)
+
+        assert loads(text.encode("utf-8")) == {"day": "2024-01-02"}
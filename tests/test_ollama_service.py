@@ -24,7 +24,7 @@ class TestOllamaService:
         assert service.host == "http://custom:11434"
         assert service.model == "custom-model"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_is_available_success(self, mock_get):
         """Test service availability check when available."""
         mock_get.return_value.status_code = 200
@@ -32,7 +32,7 @@ class TestOllamaService:
         service = OllamaService()
         assert service.is_available() is True
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_is_available_failure(self, mock_get):
         """Test service availability check when unavailable."""
         mock_get.side_effect = Exception("Connection refused")
@@ -40,7 +40,7 @@ class TestOllamaService:
         service = OllamaService()
         assert service.is_available() is False
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_list_models(self, mock_get):
         """Test listing available models."""
         mock_response = Mock()
@@ -68,3 +68,45 @@ class TestOllamaService:
         # Here we just verify the method signature
         assert hasattr(service, 'classify_document')
         assert callable(service.classify_document)
+
+    @patch('src.ollama_service.settings')
+    @patch('requests.Session.post')
+    def test_generate_round_robins_hosts(self, mock_post, mock_settings):
+        """Test requests rotate across configured Ollama hosts."""
+        mock_settings.ollama_hosts_list = ["http://gpu1:11434", "http://gpu2:11434"]
+        mock_settings.ollama_model = "llama3.2:3b"
+        mock_post.return_value.content = b'{"response": "ok"}'
+        mock_post.return_value.json.return_value = {"response": "ok"}
+
+        service = OllamaService()
+        assert service.generate("a") == "ok"
+        assert service.generate("b") == "ok"
+
+        urls = [call.args[0] for call in mock_post.call_args_list]
+        assert urls == ["http://gpu1:11434/api/generate", "http://gpu2:11434/api/generate"]
+
+    @patch('src.ollama_service.settings')
+    @patch('requests.Session.post')
+    def test_failing_host_is_quarantined(self, mock_post, mock_settings):
+        """Test a host with a high error rate is skipped."""
+        import requests
+
+        mock_settings.ollama_hosts_list = ["http://gpu1:11434", "http://gpu2:11434"]
+        mock_settings.ollama_model = "llama3.2:3b"
+
+        def post(url, **kwargs):
+            if url.startswith("http://gpu1"):
+                raise requests.exceptions.ConnectionError("down")
+            response = Mock()
+            response.content = b'{"response": "ok"}'
+            response.json.return_value = {"response": "ok"}
+            return response
+
+        mock_post.side_effect = post
+
+        service = OllamaService()
+        results = [service.generate("prompt") for _ in range(6)]
+
+        assert results[-1] == "ok"
+        assert service._quarantined_until["http://gpu1:11434"] > 0
+        assert mock_post.call_args.args[0].startswith("http://gpu2")
@@ -5,9 +5,9 @@ Measures throughput, latency, and resource usage across architectural boundaries
 """
 
 import asyncio
+import math
 import time
 import psutil
-import json
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
@@ -19,6 +19,7 @@ from src.domain import load_configuration
 from src.services import create_document_processing_service, create_ollama_service
 from src.infrastructure import create_extraction_service
 from src.services.ocr_service import TesseractOCRService
+from src.json_utils import write_json
 
 
 logger = logging.getLogger(__name__)
@@ -105,7 +106,7 @@ class PerformanceBenchmark:
     async def benchmark_ocr_operation(self, file_path: Path) -> PerformanceMetrics:
         """Benchmark OCR operation performance."""
         start_resources = self.get_resource_metrics()
-        start_time = time.time()
+        start_time = time.perf_counter()
         file_size_mb = file_path.stat().st_size / 1024 / 1024
         
         try:
@@ -123,7 +124,7 @@ class PerformanceBenchmark:
             
             result = await self.ocr_service.extract_text(str(file_path))
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_resources = self.get_resource_metrics()
             processing_time = end_time - start_time
             throughput = file_size_mb / processing_time if processing_time > 0 else 0
@@ -141,7 +142,7 @@ class PerformanceBenchmark:
             )
             
         except Exception as e:
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_resources = self.get_resource_metrics()
             processing_time = end_time - start_time
             
@@ -160,13 +161,13 @@ class PerformanceBenchmark:
     async def benchmark_extraction_operation(self, file_path: Path) -> PerformanceMetrics:
         """Benchmark document extraction performance."""
         start_resources = self.get_resource_metrics()
-        start_time = time.time()
+        start_time = time.perf_counter()
         file_size_mb = file_path.stat().st_size / 1024 / 1024
         
         try:
             result = await self.extraction_service.extract_content(file_path)
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_resources = self.get_resource_metrics()
             processing_time = end_time - start_time
             throughput = file_size_mb / processing_time if processing_time > 0 else 0
@@ -184,7 +185,7 @@ class PerformanceBenchmark:
             )
             
         except Exception as e:
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_resources = self.get_resource_metrics()
             processing_time = end_time - start_time
             
@@ -203,14 +204,14 @@ class PerformanceBenchmark:
     async def benchmark_classification_operation(self, file_path: Path) -> PerformanceMetrics:
         """Benchmark classification performance."""
         start_resources = self.get_resource_metrics()
-        start_time = time.time()
+        start_time = time.perf_counter()
         file_size_mb = file_path.stat().st_size / 1024 / 1024
         
         try:
             # First extract content
             extraction_result = await self.extraction_service.extract_content(file_path)
             if not extraction_result.is_success:
-                end_time = time.time()
+                end_time = time.perf_counter()
                 end_resources = self.get_resource_metrics()
                 processing_time = end_time - start_time
                 
@@ -230,7 +231,7 @@ class PerformanceBenchmark:
             
             result = await self.classification_service.classify_document(content, categories)
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_resources = self.get_resource_metrics()
             processing_time = end_time - start_time
             throughput = file_size_mb / processing_time if processing_time > 0 else 0
@@ -248,7 +249,7 @@ class PerformanceBenchmark:
             )
             
         except Exception as e:
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_resources = self.get_resource_metrics()
             processing_time = end_time - start_time
             
@@ -267,14 +268,14 @@ class PerformanceBenchmark:
     async def benchmark_end_to_end_operation(self, file_path: Path) -> PerformanceMetrics:
         """Benchmark complete end-to-end processing performance."""
         start_resources = self.get_resource_metrics()
-        start_time = time.time()
+        start_time = time.perf_counter()
         file_size_mb = file_path.stat().st_size / 1024 / 1024
         
         try:
             categories = self.config.get_categories()
             result = await self.document_service.process_document(file_path, categories)
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_resources = self.get_resource_metrics()
             processing_time = end_time - start_time
             throughput = file_size_mb / processing_time if processing_time > 0 else 0
@@ -292,7 +293,7 @@ class PerformanceBenchmark:
             )
             
         except Exception as e:
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_resources = self.get_resource_metrics()
             processing_time = end_time - start_time
             
@@ -330,7 +331,7 @@ class PerformanceBenchmark:
             
             for file_path in test_files:
                 if not file_path.exists():
-                    logger.warning(f"Test file not found: {file_path}")
+                    logger.warning("Test file not found: %s", file_path)
                     continue
                 
                 try:
@@ -343,7 +344,7 @@ class PerformanceBenchmark:
                     elif operation == "end_to_end":
                         metric = await self.benchmark_end_to_end_operation(file_path)
                     else:
-                        logger.warning(f"Unknown operation: {operation}")
+                        logger.warning("Unknown operation: %s", operation)
                         continue
                     
                     operation_metrics.append(metric)
@@ -353,11 +354,11 @@ class PerformanceBenchmark:
                     if metric.end_resources:
                         self.resource_history.append(metric.end_resources)
                     
-                    logger.info(f"  {file_path.name}: {metric.processing_time:.2f}s, "
-                              f"{metric.throughput_mb_per_sec:.2f} MB/s")
+                    logger.info("  %s: %.2fs, %.2f MB/s", file_path.name,
+                              metric.processing_time, metric.throughput_mb_per_sec)
                     
                 except Exception as e:
-                    logger.error(f"Benchmark failed for {file_path}: {e}")
+                    logger.error("Benchmark failed for %s: %s", file_path, e)
             
             # Calculate summary for this operation
             if operation_metrics:
@@ -384,7 +385,7 @@ class PerformanceBenchmark:
                 memory_values.append(metric.end_resources.memory_mb)
                 cpu_values.append(metric.end_resources.cpu_percent)
         
-        total_processing_time = sum(processing_times)
+        total_processing_time = math.fsum(processing_times)
         operations_per_second = len(successful_metrics) / total_processing_time if total_processing_time > 0 else 0
         
         return BenchmarkSummary(
@@ -392,20 +393,24 @@ class PerformanceBenchmark:
             successful_operations=len(successful_metrics),
             failed_operations=len(metrics) - len(successful_metrics),
             total_processing_time=total_processing_time,
-            average_processing_time=statistics.mean(processing_times) if processing_times else 0,
+            average_processing_time=statistics.fmean(processing_times) if processing_times else 0,
             median_processing_time=statistics.median(processing_times) if processing_times else 0,
-            total_throughput_mb_per_sec=sum(throughputs),
-            average_file_size_mb=statistics.mean(file_sizes) if file_sizes else 0,
+            total_throughput_mb_per_sec=math.fsum(throughputs),
+            average_file_size_mb=statistics.fmean(file_sizes) if file_sizes else 0,
             operations_per_second=operations_per_second,
             peak_memory_mb=max(memory_values) if memory_values else 0,
-            average_cpu_percent=statistics.mean(cpu_values) if cpu_values else 0
+            average_cpu_percent=statistics.fmean(cpu_values) if cpu_values else 0
         )
     
     def export_benchmark_results(self, results: Dict[str, BenchmarkSummary], output_path: Path):
         """Export benchmark results to JSON."""
         export_data = {
             "benchmark_summary": {op: asdict(summary) for op, summary in results.items()},
-            "detailed_metrics": [asdict(metric) for metric in self.metrics],
+            # Sorted by (operation, file) so exports from different runs diff cleanly
+            "detailed_metrics": [
+                asdict(metric)
+                for metric in sorted(self.metrics, key=lambda m: (m.operation, str(m.file_path)))
+            ],
             "resource_history": [asdict(resource) for resource in self.resource_history],
             "timestamp": datetime.now().isoformat(),
             "system_info": {
@@ -415,8 +420,7 @@ class PerformanceBenchmark:
             }
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        write_json(output_path, export_data, default=str)
         
         logger.info(f"Benchmark results exported to: {output_path}")
     